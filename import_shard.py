@@ -0,0 +1,45 @@
+import bpy
+import os
+import sys
+
+# Parse arguments passed after "--"
+argv = sys.argv
+argv = argv[argv.index("--") + 1:]
+
+FILE_LIST    = argv[0]   # Text file with one FBX path per line
+OUTPUT_BLEND = argv[1]   # Where to save the imported shard
+
+
+def main():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    with open(FILE_LIST, "r", encoding="utf-8") as f:
+        fbx_files = [line.strip() for line in f if line.strip()]
+
+    # Short counter names, prefixed per shard, avoid .001 suffix probing here
+    # and collisions between shards when the parent appends them
+    prefix = os.path.splitext(os.path.basename(OUTPUT_BLEND))[0] + "_o"
+    counter = 0
+
+    for path in fbx_files:
+        try:
+            before = set(bpy.data.objects)
+            bpy.ops.import_scene.fbx(filepath=path)
+            for obj in bpy.data.objects:
+                if obj in before:
+                    continue
+                obj.name = f"{prefix}{counter}"
+                if obj.data is not None and obj.data.users == 1:
+                    obj.data.name = f"{prefix}{counter}d"
+                counter += 1
+            print(f"IMPORTED {path}")
+        except Exception as e:
+            print(f"ERROR importing {path}: {e}")
+
+    # Absolute paths so the parent process can append the shard from anywhere
+    bpy.ops.wm.save_as_mainfile(filepath=OUTPUT_BLEND, compress=False,
+                                relative_remap=False)
+
+
+if __name__ == "__main__":
+    main()
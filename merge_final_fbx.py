@@ -1,12 +1,30 @@
 import bpy
+import hashlib
+import itertools
+import numpy as np
 import os
+import shutil
+import subprocess
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ---------------- CONFIG ----------------
-INPUT_DIR = sys.argv[-2]  # Directory containing batch FBX files
-OUTPUT_FBX = sys.argv[-1]  # Final merged output
+# Parse arguments passed after "--"
+argv = sys.argv
+argv = argv[argv.index("--") + 1:]
+
+INPUT_DIR = argv[0]   # Directory containing batch FBX files
+OUTPUT_FBX = argv[1]  # Final merged output
+IMPORT_WORKERS = int(argv[2]) if len(argv) > 2 else 1  # Parallel Blender import processes
 BAR_WIDTH = 40
+PROGRESS_INTERVAL = 0.05  # seconds between progress bar redraws
+last_print = [0.0]
+
+_id_counter = itertools.count()  # suffix source for rename_imported()
+
+SHARD_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_shard.py")
 
 # ---------------- HELPERS ----------------
 def format_time(seconds):
@@ -18,7 +36,44 @@ def format_time(seconds):
         return f"{h:02d}:{m:02d}:{s:02d}"
     return f"{m:02d}:{s:02d}"
 
+def material_key(mat):
+    """
+    Structural hash of a material: node types, links, image files and
+    unlinked input values. Materials that look the same share a key even
+    though each import gave them a different name (Material.001, ...).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if not (mat.use_nodes and mat.node_tree):
+        h.update(repr(tuple(mat.diffuse_color)).encode())
+        return h.digest()
+
+    tree = mat.node_tree
+    for node in sorted(tree.nodes, key=lambda n: n.name):
+        h.update(node.bl_idname.encode())
+        image = getattr(node, "image", None)
+        if image is not None:
+            h.update((image.filepath or image.name).encode())
+        for socket in node.inputs:
+            if socket.is_linked or not hasattr(socket, "default_value"):
+                continue
+            value = socket.default_value
+            try:
+                value = tuple(value)
+            except TypeError:
+                pass
+            h.update(f"{socket.identifier}={value!r}".encode())
+    for link in sorted(f"{l.from_node.name}:{l.from_socket.identifier}>"
+                       f"{l.to_node.name}:{l.to_socket.identifier}" for l in tree.links):
+        h.update(link.encode())
+    return h.digest()
+
 def print_progress(current, total, elapsed, last_file):
+    # Redraw at most every PROGRESS_INTERVAL; the final item always prints
+    now = time.time()
+    if current != total and now - last_print[0] < PROGRESS_INTERVAL:
+        return
+    last_print[0] = now
+
     progress = current / total
     filled = int(BAR_WIDTH * progress)
     bar = "█" * filled + "─" * (BAR_WIDTH - filled)
@@ -32,7 +87,253 @@ def print_progress(current, total, elapsed, last_file):
         f"Last: {last_file}"
     )
 
-    print("\r" + line[:120], end="", flush=True)
+    # Straight to fd 1; flush first so earlier print() output stays in order
+    sys.stdout.flush()
+    os.write(1, ("\r" + line[:120]).encode("utf-8", "replace"))
+
+def run_import_shard(files, shard_idx, shard_dir):
+    """
+    Import a subset of the batch FBX files in a separate background Blender
+    and save them as a .blend. Runs on a worker thread; returns
+    (files, blend_path or None, error lines).
+    """
+    list_path = os.path.join(shard_dir, f"shard_{shard_idx:02d}.txt")
+    blend_path = os.path.join(shard_dir, f"shard_{shard_idx:02d}.blend")
+    with open(list_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(os.path.join(INPUT_DIR, name) for name in files))
+
+    result = subprocess.run(
+        [bpy.app.binary_path, "--background", "--factory-startup",
+         "--python-exit-code", "1", "--python", SHARD_SCRIPT,
+         "--", list_path, blend_path],
+        capture_output=True, text=True, errors="replace"
+    )
+    errors = [line for line in result.stdout.splitlines()
+              if line.startswith("ERROR importing")]
+    if result.returncode != 0 or not os.path.exists(blend_path):
+        errors.append(f"ERROR: import shard {shard_idx} exited with code {result.returncode}")
+        return files, None, errors
+    return files, blend_path, errors
+
+def rename_imported(objects, prefix="o"):
+    """
+    Give freshly imported objects (and their single-user meshes) short
+    counter names. Everything is joined later, so names carry no meaning,
+    and unique names keep Blender from probing .001/.002 suffixes.
+    """
+    for obj in objects:
+        n = next(_id_counter)
+        obj.name = f"{prefix}{n}"
+        if obj.data is not None and obj.data.users == 1:
+            obj.data.name = f"{prefix}{n}d"
+
+def append_blend_objects(blend_path):
+    """Append every object of a .blend into the current scene (no FBX reparse)."""
+    with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
+        data_to.objects = data_from.objects
+    objects = [obj for obj in data_to.objects if obj is not None]
+    for obj in objects:
+        bpy.context.scene.collection.objects.link(obj)
+    rename_imported(objects)
+
+# Generic attributes join_meshes() carries over: data_type -> (foreach field,
+# components, buffer dtype). Types not listed here are dropped.
+_ATTR_LAYOUT = {
+    "FLOAT":        ("value",  1, np.float32),
+    "INT":          ("value",  1, np.int32),
+    "INT8":         ("value",  1, np.int32),
+    "BOOLEAN":      ("value",  1, bool),
+    "FLOAT2":       ("vector", 2, np.float32),
+    "FLOAT_VECTOR": ("vector", 3, np.float32),
+    "FLOAT_COLOR":  ("color",  4, np.float32),
+    "BYTE_COLOR":   ("color",  4, np.float32),
+}
+# Attributes join_meshes() rebuilds itself (or that edges regenerate)
+_ATTR_SKIP = {"position", "material_index", "sharp_face", "sharp_edge", "custom_normal"}
+
+
+def get_corner_normals(me, out):
+    """Fill out (flat float32, 3 per loop) with the mesh's corner normals."""
+    if hasattr(me, "corner_normals"):        # Blender 4.1+
+        me.corner_normals.foreach_get("vector", out)
+    else:
+        me.calc_normals_split()
+        me.loops.foreach_get("normal", out)
+
+
+def join_meshes(objects, name="Merged"):
+    """
+    Merge mesh objects into one new object by copying vertex/loop/face
+    arrays straight into preallocated numpy buffers (world transforms,
+    custom split normals, all UV layers, colour and other generic
+    attributes, smooth flags and material slots are carried over).
+    Replaces bpy.ops.object.join(), whose per-operand overhead grows with
+    object count. Source objects and meshes are removed afterwards.
+    """
+    total_v = sum(len(o.data.vertices) for o in objects)
+    total_l = sum(len(o.data.loops) for o in objects)
+    total_p = sum(len(o.data.polygons) for o in objects)
+    domain_size = {"POINT": total_v, "CORNER": total_l, "FACE": total_p}
+
+    co         = np.empty(total_v * 3, dtype=np.float32)
+    loop_verts = np.empty(total_l, dtype=np.int32)
+    loop_start = np.empty(total_p, dtype=np.int32)
+    mat_index  = np.zeros(total_p, dtype=np.int32)
+    smooth     = np.empty(total_p, dtype=bool)
+
+    # Custom normals only when some source has them; otherwise the merged
+    # mesh derives its normals from the smooth flags just like the sources
+    normals = None
+    if any(o.data.has_custom_normals for o in objects):
+        normals = np.empty(total_l * 3, dtype=np.float32)
+
+    # Buffers created on first sight of a name, zero-filled for meshes
+    # that lack it (as join does)
+    uv_buffers = {}     # name -> flat float32, 2 per loop
+    attr_buffers = {}   # name -> (domain, data_type, flat buffer)
+    active_uv = active_color = None
+
+    materials = []
+    material_lookup = {}
+    voff = loff = poff = 0
+
+    for obj in objects:
+        me = obj.data
+        nv, nl, np_ = len(me.vertices), len(me.loops), len(me.polygons)
+        offsets = {"POINT": voff, "CORNER": loff, "FACE": poff}
+
+        verts = co[voff * 3:(voff + nv) * 3]
+        me.vertices.foreach_get("co", verts)
+        matrix = np.array(obj.matrix_world, dtype=np.float32)
+        verts3 = verts.reshape(-1, 3)
+        verts3[:] = verts3 @ matrix[:3, :3].T + matrix[:3, 3]
+
+        if normals is not None:
+            corner = normals[loff * 3:(loff + nl) * 3]
+            get_corner_normals(me, corner)
+            # Normals transform by the inverse transpose; row vectors here
+            corner3 = corner.reshape(-1, 3)
+            corner3[:] = corner3 @ np.linalg.inv(matrix[:3, :3])
+            lengths = np.linalg.norm(corner3, axis=1, keepdims=True)
+            np.divide(corner3, lengths, out=corner3, where=lengths > 0)
+
+        # Offset indices so they point into the concatenated buffers
+        loops = loop_verts[loff:loff + nl]
+        me.loops.foreach_get("vertex_index", loops)
+        loops += voff
+
+        starts = loop_start[poff:poff + np_]
+        me.polygons.foreach_get("loop_start", starts)
+        starts += loff
+
+        me.polygons.foreach_get("use_smooth", smooth[poff:poff + np_])
+
+        uv_names = set()
+        for layer in me.uv_layers:
+            uv_names.add(layer.name)
+            buf = uv_buffers.get(layer.name)
+            if buf is None:
+                buf = uv_buffers[layer.name] = np.zeros(total_l * 2, dtype=np.float32)
+            layer.data.foreach_get("uv", buf[loff * 2:(loff + nl) * 2])
+        if active_uv is None and me.uv_layers.active:
+            active_uv = me.uv_layers.active.name
+
+        for attr in me.attributes:
+            layout = _ATTR_LAYOUT.get(attr.data_type)
+            if (layout is None or attr.domain not in domain_size
+                    or attr.name in _ATTR_SKIP or attr.name in uv_names
+                    or attr.name.startswith(".")):
+                continue
+            field, width, dtype = layout
+            entry = attr_buffers.get(attr.name)
+            if entry is None:
+                entry = attr_buffers[attr.name] = (
+                    attr.domain, attr.data_type,
+                    np.zeros(domain_size[attr.domain] * width, dtype=dtype))
+            domain, data_type, buf = entry
+            if domain != attr.domain or data_type != attr.data_type:
+                continue  # same name, different layout; keep the first one
+            off = offsets[domain]
+            attr.data.foreach_get(field, buf[off * width:(off + len(attr.data)) * width])
+        if active_color is None and me.color_attributes.active_color:
+            active_color = me.color_attributes.active_color.name
+
+        slots = obj.material_slots
+        if slots:
+            slot_map = np.empty(len(slots), dtype=np.int32)
+            for i, slot in enumerate(slots):
+                mat = slot.material
+                if mat not in material_lookup:
+                    material_lookup[mat] = len(materials)
+                    materials.append(mat)
+                slot_map[i] = material_lookup[mat]
+            indices = np.empty(np_, dtype=np.int32)
+            me.polygons.foreach_get("material_index", indices)
+            np.clip(indices, 0, len(slots) - 1, out=indices)
+            mat_index[poff:poff + np_] = slot_map[indices]
+
+        voff += nv
+        loff += nl
+        poff += np_
+
+    new_mesh = bpy.data.meshes.new(name)
+    new_mesh.vertices.add(total_v)
+    new_mesh.vertices.foreach_set("co", co)
+    new_mesh.loops.add(total_l)
+    new_mesh.loops.foreach_set("vertex_index", loop_verts)
+    new_mesh.polygons.add(total_p)
+    new_mesh.polygons.foreach_set("loop_start", loop_start)
+    new_mesh.polygons.foreach_set("material_index", mat_index)
+    new_mesh.polygons.foreach_set("use_smooth", smooth)
+    for uv_name, buf in uv_buffers.items():
+        new_mesh.uv_layers.new(name=uv_name).data.foreach_set("uv", buf)
+    if active_uv is not None:
+        layer = new_mesh.uv_layers[active_uv]
+        new_mesh.uv_layers.active = layer
+        layer.active_render = True
+    for attr_name, (domain, data_type, buf) in attr_buffers.items():
+        attr = new_mesh.attributes.new(attr_name, data_type, domain)
+        attr.data.foreach_set(_ATTR_LAYOUT[data_type][0], buf)
+    if active_color is not None and active_color in new_mesh.color_attributes:
+        new_mesh.color_attributes.active_color = new_mesh.color_attributes[active_color]
+    for mat in materials:
+        new_mesh.materials.append(mat)
+    new_mesh.update(calc_edges=True)
+    if normals is not None:
+        if hasattr(new_mesh, "use_auto_smooth"):  # required before Blender 4.1
+            new_mesh.use_auto_smooth = True
+        new_mesh.normals_split_custom_set(normals.reshape(-1, 3))
+
+    merged = bpy.data.objects.new(name, new_mesh)
+    bpy.context.scene.collection.objects.link(merged)
+
+    old_meshes = {o.data for o in objects}
+    bpy.data.batch_remove(list(objects) + list(old_meshes))
+    return merged
+
+def suspend_scene_updates():
+    """
+    Detach depsgraph handlers and enable simplify for a bulk import.
+    Returns the state resume_scene_updates() needs to undo it.
+    """
+    scene = bpy.context.scene
+    handlers = bpy.app.handlers.depsgraph_update_post
+    state = (handlers[:], scene.render.use_simplify, scene.render.simplify_subdivision)
+    handlers.clear()
+    scene.render.use_simplify = True
+    scene.render.simplify_subdivision = 0
+    return state
+
+
+def resume_scene_updates(state):
+    """Restore handlers/simplify and evaluate the scene once."""
+    saved_handlers, use_simplify, simplify_subdivision = state
+    scene = bpy.context.scene
+    bpy.app.handlers.depsgraph_update_post.extend(saved_handlers)
+    scene.render.use_simplify = use_simplify
+    scene.render.simplify_subdivision = simplify_subdivision
+    scene.frame_set(scene.frame_current)
+    bpy.context.view_layer.update()
 
 # ---------------- START ----------------
 start_time = time.time()
@@ -41,6 +342,7 @@ print("Final FBX Merge Started")
 print("=" * 60)
 print(f"Input directory: {INPUT_DIR}")
 print(f"Output file: {OUTPUT_FBX}")
+print(f"Import workers: {IMPORT_WORKERS}")
 print()
 
 # Reset scene
@@ -58,22 +360,88 @@ print(f"Found {total} batch FBX files to merge")
 print()
 
 # ---------------- IMPORT WITH PROGRESS ----------------
-print("Importing batch FBX files...")
-imported_count = 0
-failed_count = 0
-
-for idx, file in enumerate(fbx_files, 1):
-    path = os.path.join(INPUT_DIR, file)
-
+# Batches whose .blend sidecar is at least as new as the FBX are appended
+# directly (already-parsed data, no FBX reparse); the rest fall back to FBX
+blend_inputs = {}
+for file in fbx_files:
+    fbx_path = os.path.join(INPUT_DIR, file)
+    blend_path = os.path.splitext(fbx_path)[0] + ".blend"
     try:
-        bpy.ops.import_scene.fbx(filepath=path)
-        imported_count += 1
-    except Exception as e:
-        print(f"\nERROR importing {file}: {e}")
-        failed_count += 1
+        if os.path.getmtime(blend_path) >= os.path.getmtime(fbx_path):
+            blend_inputs[file] = blend_path
+    except OSError:
+        pass
 
-    elapsed = time.time() - start_time
-    print_progress(idx, total, elapsed, file)
+imported_count = 0
+failed_count = 0
+done = 0
+fbx_inputs = [f for f in fbx_files if f not in blend_inputs]
+
+# Handlers and simplify are suspended for the whole loop so imports don't
+# each trigger a full scene evaluation; the scene is updated once afterwards
+scene_state = suspend_scene_updates()
+try:
+    if blend_inputs:
+        print(f"Appending {len(blend_inputs)} batch .blend files...")
+        for file, blend_path in blend_inputs.items():
+            try:
+                append_blend_objects(blend_path)
+                imported_count += 1
+            except Exception as e:
+                print(f"\nWARNING appending {os.path.basename(blend_path)}: {e}; using FBX")
+                fbx_inputs.append(file)
+                continue
+
+            done += 1
+            elapsed = time.time() - start_time
+            print_progress(done, total, elapsed, file)
+
+    workers = max(1, min(IMPORT_WORKERS, len(fbx_inputs)))
+    if fbx_inputs and workers > 1:
+        # Each worker Blender imports a round-robin shard and saves it as .blend;
+        # shards are appended here as they finish, skipping a second FBX parse
+        print(f"Importing batch FBX files with {workers} parallel Blender workers...")
+        shard_dir = tempfile.mkdtemp(prefix="fbx_import_shards_")
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(run_import_shard, fbx_inputs[i::workers], i, shard_dir)
+                           for i in range(workers)]
+                for future in as_completed(futures):
+                    shard_files, blend_path, errors = future.result()
+                    for line in errors:
+                        print(f"\n{line}")
+                    if blend_path:
+                        append_blend_objects(blend_path)
+                        failed = sum(1 for line in errors if line.startswith("ERROR importing"))
+                        imported_count += len(shard_files) - failed
+                        failed_count += failed
+                    else:
+                        failed_count += len(shard_files)
+
+                    done += len(shard_files)
+                    elapsed = time.time() - start_time
+                    print_progress(done, total, elapsed, shard_files[-1])
+        finally:
+            shutil.rmtree(shard_dir, ignore_errors=True)
+    elif fbx_inputs:
+        print("Importing batch FBX files...")
+        for file in fbx_inputs:
+            path = os.path.join(INPUT_DIR, file)
+
+            try:
+                before = set(bpy.data.objects)
+                bpy.ops.import_scene.fbx(filepath=path)
+                rename_imported([obj for obj in bpy.data.objects if obj not in before])
+                imported_count += 1
+            except Exception as e:
+                print(f"\nERROR importing {file}: {e}")
+                failed_count += 1
+
+            done += 1
+            elapsed = time.time() - start_time
+            print_progress(done, total, elapsed, file)
+finally:
+    resume_scene_updates(scene_state)
 
 print()  # newline after progress bar
 print(f"Successfully imported: {imported_count}/{total}")
@@ -95,25 +463,32 @@ print()
 # ---------------- MATERIAL OPTIMIZATION ----------------
 print("Optimizing materials...")
 
-# Remove duplicate materials
-material_map = {}
-removed_materials = 0
-
+# Remove duplicate materials: group by structural hash in one pass, then remap
+# every slot with a dict lookup instead of rescanning the scene per duplicate
+material_groups = {}
 for mat in bpy.data.materials:
-    if mat.name not in material_map:
-        material_map[mat.name] = mat
-    else:
-        # Replace references to duplicate materials
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                for slot in obj.material_slots:
-                    if slot.material == mat:
-                        slot.material = material_map[mat.name]
-        bpy.data.materials.remove(mat)
-        removed_materials += 1
+    material_groups.setdefault(material_key(mat), []).append(mat)
+
+material_remap = {}
+for mats in material_groups.values():
+    keep = mats[0]
+    for dup in mats[1:]:
+        material_remap[dup] = keep
+
+for obj in bpy.data.objects:
+    if obj.type == 'MESH':
+        for slot in obj.material_slots:
+            replacement = material_remap.get(slot.material)
+            if replacement:
+                slot.material = replacement
+
+# Duplicates are now unreferenced; one recursive purge drops them (and any
+# other orphaned data) instead of a dependency walk per removed material
+bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=False, do_recursive=True)
+removed_materials = len(material_remap)
 
 print(f"Removed {removed_materials} duplicate materials")
-print(f"Unique materials: {len(material_map)}")
+print(f"Unique materials: {len(material_groups)}")
 print()
 
 # ---------------- SELECT & JOIN ----------------
@@ -121,19 +496,15 @@ print(f"Joining {total_meshes} meshes into single object...")
 
 bpy.ops.object.select_all(action='DESELECT')
 
-for obj in mesh_objects:
-    obj.select_set(True)
-    bpy.context.view_layer.objects.active = obj
-
-# Join all meshes
 join_start = time.time()
-bpy.ops.object.join()
+merged_obj = join_meshes(mesh_objects)
+merged_obj.select_set(True)
+bpy.context.view_layer.objects.active = merged_obj
 join_time = time.time() - join_start
 
 print(f"Join completed in {format_time(join_time)}")
 
 # Get final merged object
-merged_obj = bpy.context.view_layer.objects.active
 if merged_obj:
     vertex_count = len(merged_obj.data.vertices)
     face_count = len(merged_obj.data.polygons)
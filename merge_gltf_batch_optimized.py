@@ -1,6 +1,15 @@
 import bpy
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import numpy as np
 import sys
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from urllib.parse import unquote
 
 # Parse arguments passed after "--"
 argv = sys.argv
@@ -18,34 +27,346 @@ MAX_RAY_DISTANCE = float(argv[6]) if len(argv) > 6 else 1.0
 ENABLE_DECIMATION   = (argv[7] == "1") if len(argv) > 7 else True
 ENABLE_BAKING       = (argv[8] == "1") if len(argv) > 8 else True
 REMOVE_HIGH_POLY    = (argv[9] == "1") if len(argv) > 9 else True
+SAVE_BATCH_BLEND    = (argv[10] == "1") if len(argv) > 10 else True
+
+# Normal maps are baked from an undecimated copy onto the decimated mesh;
+# when decimation is off or barely changes the mesh there is no detail to
+# bake, so the bake and its material nodes are skipped
+BAKE_NORMALS = ENABLE_BAKING and ENABLE_DECIMATION and DECIMATE_RATIO < 0.99
+
+# meshoptimizer settings (used when the library can be loaded)
+MESHOPT_CACHE_SIZE   = 16    # FIFO cache size for vertex-cache optimization
+MESHOPT_TARGET_ERROR = 1.0   # relative error cap; 1.0 lets DECIMATE_RATIO decide, like the modifier
+
+# Content key -> names of the objects created by the first import of that content (LRU)
+GLTF_CACHE_SIZE = 32
+_gltf_cache = OrderedDict()
+
+# Diffuse texture path -> shared diffuse-only material (see shared_diffuse_material)
+_diffuse_materials = {}
+
+# Background PNG encoders for baked normal maps; saves are wired into the
+# materials once they have all finished (see attach_normal_maps)
+PNG_SAVE_WORKERS = 2
+_pending_normal_maps = []
+# Output path -> latest background save; objects sharing a base name write
+# the same file, and two workers must never write one path at once
+_png_saves = {}
+
+# Diffuse texture extensions, in lookup priority order
+TEXTURE_EXTENSIONS = (".png", ".jpg", ".jpeg")
 
 
 def reset_scene():
     bpy.ops.wm.read_factory_settings(use_empty=True)
 
 
+def configure_cycles_device():
+    """
+    Switch the scene to Cycles and bake on the first available GPU backend
+    (OptiX, CUDA, HIP, Metal, oneAPI). Falls back to CPU when none is found.
+    Must run after reset_scene(), which restores factory preferences.
+    """
+    scene = bpy.context.scene
+    scene.render.engine = 'CYCLES'
+    # NORMAL bakes are geometric; extra samples only add anti-aliasing time
+    scene.cycles.samples = 1
+
+    addon = bpy.context.preferences.addons.get('cycles')
+    if addon is None:
+        print("Cycles bake device: CPU (Cycles preferences unavailable)")
+        return
+
+    prefs = addon.preferences
+    for device_type in ('OPTIX', 'CUDA', 'HIP', 'METAL', 'ONEAPI'):
+        try:
+            prefs.compute_device_type = device_type
+        except TypeError:
+            continue   # backend not compiled into this Blender build
+        prefs.get_devices()
+        gpus = [d for d in prefs.devices if d.type == device_type]
+        if not gpus:
+            continue
+        for d in prefs.devices:
+            d.use = (d.type == device_type)
+        scene.cycles.device = 'GPU'
+        # One tile per normal map; small tiles starve the GPU during baking
+        scene.cycles.tile_size = NORMAL_MAP_RES
+        print(f"Cycles bake device: GPU ({device_type}: {', '.join(d.name for d in gpus)})")
+        return
+
+    prefs.compute_device_type = 'NONE'
+    scene.cycles.device = 'CPU'
+    print("Cycles bake device: CPU (no supported GPU found)")
+
+
+def configure_bake_settings():
+    """Set the scene-wide NORMAL bake options once, before the per-object loop."""
+    scene = bpy.context.scene
+    scene.cycles.bake_type = 'NORMAL'
+    scene.render.bake.use_selected_to_active = True
+
+    # BUG FIX: were hardcoded to 0.1 / 1.0; now use values from config via CLI
+    scene.render.bake.cage_extrusion    = CAGE_EXTRUSION
+    scene.render.bake.max_ray_distance  = MAX_RAY_DISTANCE
+
+
+def load_meshoptimizer():
+    """
+    Load the meshoptimizer C library through ctypes, trying the
+    MESHOPTIMIZER_LIB environment variable first and then the system
+    library path. Returns None when it is not available, in which case
+    decimation falls back to Blender's DECIMATE modifier.
+    """
+    size_t, ptr = ctypes.c_size_t, ctypes.c_void_p
+    for path in (os.environ.get("MESHOPTIMIZER_LIB"), ctypes.util.find_library("meshoptimizer")):
+        if not path:
+            continue
+        try:
+            lib = ctypes.CDLL(path)
+        except OSError:
+            continue
+        lib.meshopt_generateVertexRemap.argtypes = [ptr, ptr, size_t, ptr, size_t, size_t]
+        lib.meshopt_generateVertexRemap.restype = size_t
+        lib.meshopt_remapIndexBuffer.argtypes = [ptr, ptr, size_t, ptr]
+        lib.meshopt_remapIndexBuffer.restype = None
+        lib.meshopt_remapVertexBuffer.argtypes = [ptr, ptr, size_t, size_t, ptr]
+        lib.meshopt_remapVertexBuffer.restype = None
+        lib.meshopt_simplify.argtypes = [ptr, ptr, size_t, ptr, size_t, size_t,
+                                         size_t, ctypes.c_float, ctypes.c_uint, ptr]
+        lib.meshopt_simplify.restype = size_t
+        lib.meshopt_optimizeVertexCacheFifo.argtypes = [ptr, ptr, size_t, size_t, ctypes.c_uint]
+        lib.meshopt_optimizeVertexCacheFifo.restype = None
+        lib.meshopt_optimizeVertexFetch.argtypes = [ptr, ptr, size_t, ptr, size_t, size_t]
+        lib.meshopt_optimizeVertexFetch.restype = size_t
+        return lib
+    return None
+
+
+def read_triangle_corners(mesh):
+    """
+    Return one interleaved float32 row (x, y, z, u, v, material, smooth) per
+    triangle corner, using the active UV layer (zeros when the mesh has none).
+    The face's material index and smooth flag are part of the row so that
+    welding keeps faces with different values apart through simplification.
+    """
+    tris = mesh.loop_triangles
+    corner_loops = np.empty(len(tris) * 3, dtype=np.int32)
+    tris.foreach_get("loops", corner_loops)
+    tri_polys = np.empty(len(tris), dtype=np.int32)
+    tris.foreach_get("polygon_index", tri_polys)
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    corners = np.zeros((len(corner_loops), 7), dtype=np.float32)
+    corners[:, :3] = co.reshape(-1, 3)[loop_verts[corner_loops]]
+    if mesh.uv_layers.active:
+        uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", uv)
+        corners[:, 3:5] = uv.reshape(-1, 2)[corner_loops]
+
+    poly_count = len(mesh.polygons)
+    material = np.empty(poly_count, dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material)
+    smooth = np.empty(poly_count, dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+    corners[:, 5] = np.repeat(material[tri_polys], 3)
+    corners[:, 6] = np.repeat(smooth[tri_polys], 3)
+    return corners
+
+
+def meshopt_simplify_corners(lib, corners, ratio):
+    """
+    Weld identical corners, simplify to ratio of the original triangle count
+    and optimize for vertex cache and fetch. Pure numpy/ctypes, no bpy access.
+    Returns (vertices[N, 7], triangle indices).
+    """
+    count  = len(corners)
+    stride = corners.strides[0]
+    width  = corners.shape[1]
+
+    remap  = np.empty(count, dtype=np.uint32)
+    unique = lib.meshopt_generateVertexRemap(remap.ctypes.data, None, count,
+                                             corners.ctypes.data, count, stride)
+    indices = np.empty(count, dtype=np.uint32)
+    lib.meshopt_remapIndexBuffer(indices.ctypes.data, None, count, remap.ctypes.data)
+    vertices = np.empty((unique, width), dtype=np.float32)
+    lib.meshopt_remapVertexBuffer(vertices.ctypes.data, corners.ctypes.data,
+                                  count, stride, remap.ctypes.data)
+
+    target     = max(3, int(count * ratio) // 3 * 3)
+    simplified = np.empty(count, dtype=np.uint32)
+    new_count  = lib.meshopt_simplify(simplified.ctypes.data, indices.ctypes.data, count,
+                                      vertices.ctypes.data, unique, stride,
+                                      target, MESHOPT_TARGET_ERROR, 0, None)
+
+    cached = np.empty(new_count, dtype=np.uint32)
+    lib.meshopt_optimizeVertexCacheFifo(cached.ctypes.data, simplified.ctypes.data,
+                                        new_count, unique, MESHOPT_CACHE_SIZE)
+    fetched = np.empty((unique, width), dtype=np.float32)
+    used = lib.meshopt_optimizeVertexFetch(fetched.ctypes.data, cached.ctypes.data, new_count,
+                                           vertices.ctypes.data, unique, stride)
+    return fetched[:used], cached
+
+
+def write_triangle_mesh(mesh, vertices, indices):
+    """
+    Replace mesh geometry with indexed triangles. Columns 3-4 of vertices
+    are UV, 5-6 the face's material index and smooth flag (every corner of
+    a triangle carries the same values, so the first corner is used).
+    """
+    uv_name = mesh.uv_layers.active.name if mesh.uv_layers.active else "UVMap"
+    tri_count = len(indices) // 3
+
+    mesh.clear_geometry()
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(vertices[:, :3]).ravel())
+    mesh.loops.add(len(indices))
+    mesh.loops.foreach_set("vertex_index", indices.astype(np.int32))
+    mesh.polygons.add(tri_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(indices), 3, dtype=np.int32))
+    first = vertices[indices[0::3]]
+    mesh.polygons.foreach_set("material_index", first[:, 5].astype(np.int32))
+    mesh.polygons.foreach_set("use_smooth", first[:, 6] > 0.5)
+    mesh.uv_layers.new(name=uv_name).data.foreach_set(
+        "uv", np.ascontiguousarray(vertices[indices, 3:5]).ravel())
+    mesh.update(calc_edges=True)
+
+
+def meshopt_decimate(lib, obj, simplified=None):
+    """
+    Decimate obj's mesh in place with meshoptimizer instead of the DECIMATE modifier.
+    simplified is an optional future from prefetch_decimation() for this mesh.
+    """
+    if simplified is None:
+        corners = read_triangle_corners(obj.data)
+        if len(corners) == 0:
+            return
+        vertices, indices = meshopt_simplify_corners(lib, corners, DECIMATE_RATIO)
+    else:
+        vertices, indices = simplified.result()
+    write_triangle_mesh(obj.data, vertices, indices)
+
+
+def prefetch_decimation(pool, lib, obj):
+    """
+    Read obj's corners now (bpy, main thread) and simplify them on pool so
+    the work overlaps the current object's bake. ctypes releases the GIL
+    during meshoptimizer calls. Returns None for meshes with no triangles.
+    """
+    corners = read_triangle_corners(obj.data)
+    if len(corners) == 0:
+        return None
+    return pool.submit(meshopt_simplify_corners, lib, corners, DECIMATE_RATIO)
+
+
+def gltf_content_key(path):
+    """
+    Hash a .gltf together with the buffers and images it references, so the
+    same asset exported under different file names maps to the same key.
+    Raises OSError if the file or a referenced resource cannot be read.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        doc = json.loads(raw)
+    except ValueError:
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    base_dir = os.path.dirname(path)
+    for section in ("buffers", "images"):
+        for entry in doc.get(section, []):
+            uri = entry.get("uri")
+            if uri and not uri.startswith("data:"):
+                with open(os.path.join(base_dir, unquote(uri)), "rb") as f:
+                    entry["uri"] = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    return hashlib.blake2b(json.dumps(doc, sort_keys=True).encode("utf-8"),
+                           digest_size=16).hexdigest()
+
+
+def clone_objects(sources):
+    """Duplicate previously imported objects, giving each clone its own mesh data."""
+    clones = {}
+    for src in sources:
+        obj = src.copy()
+        if src.data is not None:
+            # Decimation edits meshes in place, so clones cannot share data
+            obj.data = src.data.copy()
+        bpy.context.collection.objects.link(obj)
+        clones[src] = obj
+    for src, obj in clones.items():
+        if src.parent in clones:
+            obj.parent = clones[src.parent]
+
+
 def import_gltf(path):
-    """Import a single GLTF file."""
+    """Import a single GLTF file, cloning an earlier import with identical content."""
+    try:
+        key = gltf_content_key(path)
+    except OSError:
+        key = None
+
+    cached = _gltf_cache.get(key) if key else None
+    if cached:
+        sources = [bpy.data.objects.get(name) for name in cached]
+        if all(sources):
+            _gltf_cache.move_to_end(key)
+            clone_objects(sources)
+            print(f"Reused cached import for {path}")
+            return True
+
     try:
+        before = set(bpy.context.scene.objects)
         bpy.ops.import_scene.gltf(filepath=path)
+        if key:
+            _gltf_cache[key] = [o.name for o in bpy.context.scene.objects if o not in before]
+            if len(_gltf_cache) > GLTF_CACHE_SIZE:
+                _gltf_cache.popitem(last=False)
         return True
     except Exception as e:
         print(f"ERROR importing {path}: {e}")
         return False
 
 
-def find_texture(base_name, texture_dir):
+def build_texture_index(texture_dir):
+    """
+    Map lower-case file stem -> texture path with one directory scan,
+    preferring extensions in TEXTURE_EXTENSIONS order like the old probing.
+    """
+    index = {}
+    rank  = {}
+    with os.scandir(texture_dir) as entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name.lower())
+            if ext not in TEXTURE_EXTENSIONS or not entry.is_file():
+                continue
+            priority = TEXTURE_EXTENSIONS.index(ext)
+            if stem not in index or priority < rank[stem]:
+                index[stem] = entry.path
+                rank[stem]  = priority
+    return index
+
+
+def find_texture(base_name, texture_index):
     """Find texture file for a given base name."""
-    for ext in (".png", ".jpg", ".jpeg"):
-        texture_path = os.path.join(texture_dir, base_name + ext)
-        if os.path.exists(texture_path):
-            return texture_path
-    return None
+    return texture_index.get(base_name.lower())
 
 
-def create_normal_bake_material(obj, diffuse_texture_path):
-    """Create material with diffuse texture for normal baking."""
-    mat = bpy.data.materials.new(name=f"Mat_{obj.name}")
+def build_object_meta(mesh_objects, texture_index):
+    """Map each mesh object to (base_name, diffuse texture path) once, before baking."""
+    meta = {}
+    for obj in mesh_objects:
+        base_name = os.path.splitext(obj.name.rsplit('.', 1)[0])[0]
+        meta[obj] = (base_name, find_texture(base_name, texture_index))
+    return meta
+
+
+def build_diffuse_material(name, diffuse_texture_path):
+    """Create a node material that feeds the diffuse texture into a Principled BSDF."""
+    mat = bpy.data.materials.new(name=name)
     mat.use_nodes = True
     nodes = mat.node_tree.nodes
     links = mat.node_tree.links
@@ -55,30 +376,160 @@ def create_normal_bake_material(obj, diffuse_texture_path):
     bsdf     = nodes.new("ShaderNodeBsdfPrincipled")
     out      = nodes.new("ShaderNodeOutputMaterial")
 
-    if diffuse_texture_path and os.path.exists(diffuse_texture_path):
+    # Paths come from the scandir index, so they are known to exist
+    if diffuse_texture_path:
         tex_node.image = bpy.data.images.load(diffuse_texture_path, check_existing=True)
 
     links.new(tex_node.outputs["Color"], bsdf.inputs["Base Color"])
     links.new(bsdf.outputs["BSDF"], out.inputs["Surface"])
+    return mat
 
+
+def assign_material(obj, mat):
+    """Replace all material slots of obj with mat."""
     obj.data.materials.clear()
     obj.data.materials.append(mat)
+
+
+def create_normal_bake_material(obj, diffuse_texture_path):
+    """Create material with diffuse texture for normal baking."""
+    mat = build_diffuse_material(f"Mat_{obj.name}", diffuse_texture_path)
+    assign_material(obj, mat)
     return mat
 
 
-def decimate_and_bake(obj):
+def shared_diffuse_material(obj, diffuse_texture_path):
+    """
+    Assign the diffuse-only material for this texture, building its node
+    graph once per batch. Only for materials that are never edited per
+    object (no bake, or a high-poly bake source).
+    """
+    mat = _diffuse_materials.get(diffuse_texture_path)
+    if mat is None:
+        stem = os.path.splitext(os.path.basename(diffuse_texture_path or "untextured"))[0]
+        mat  = build_diffuse_material(f"Mat_{stem}", diffuse_texture_path)
+        _diffuse_materials[diffuse_texture_path] = mat
+    assign_material(obj, mat)
+    return mat
+
+
+def load_png_encoder():
+    """
+    Return encode(pixels, width, height, path) writing an RGB PNG from
+    Blender's bottom-up float RGBA pixels, using Pillow or OpenImageIO.
+    Returns None when neither is importable (saves then stay synchronous).
+    """
+    def to_rgb8(pixels, width, height):
+        rgb = pixels.reshape(height, width, 4)[::-1, :, :3]
+        return (np.clip(rgb, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+    if Image is not None:
+        def encode(pixels, width, height, path):
+            Image.fromarray(to_rgb8(pixels, width, height)).save(
+                path, optimize=False, compress_level=1)
+        return encode
+
+    try:
+        import OpenImageIO as oiio
+    except ImportError:
+        return None
+
+    def encode(pixels, width, height, path):
+        spec = oiio.ImageSpec(width, height, 3, "uint8")
+        spec.attribute("png:compressionLevel", 1)
+        out = oiio.ImageOutput.create(path)
+        if out is None:
+            raise RuntimeError(oiio.geterror())
+        try:
+            out.open(path, spec)
+            out.write_image(to_rgb8(pixels, width, height))
+        finally:
+            out.close()
+    return encode
+
+
+def save_normal_map(bake_image, path, save_png=None):
+    """
+    Write the bake buffer to path. With save_png the pixels are copied out
+    and encoded on a worker thread, returning its future; otherwise the
+    image is saved synchronously by Blender and None is returned.
+    """
+    if save_png is None:
+        bake_image.filepath_raw = path
+        bake_image.file_format  = 'PNG'
+        bake_image.save()
+        return None
+
+    width, height = bake_image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    bake_image.pixels.foreach_get(pixels)
+    # Same file as an earlier object: let that save finish first, so the
+    # later bake wins as it did with synchronous saves
+    previous = _png_saves.get(path)
+    if previous is not None:
+        wait([previous])
+    future = _png_saves[path] = save_png(pixels, width, height, path)
+    return future
+
+
+def attach_normal_maps():
+    """Wire every saved normal map into its material once all saves are done."""
+    for mat, path, future in _pending_normal_maps:
+        if future is not None and future.exception() is not None:
+            print(f"WARNING: Failed to save normal map {path}: {future.exception()}")
+            continue
+
+        nodes = mat.node_tree.nodes
+        normal_map_node = nodes.new("ShaderNodeNormalMap")
+        normal_tex_node = nodes.new("ShaderNodeTexImage")
+        # check_existing would hand back the bake buffer after a synchronous
+        # save, since that buffer carries the last saved filepath
+        normal_tex_node.image = bpy.data.images.load(path, check_existing=False)
+
+        bsdf = next((n for n in nodes if n.type == 'BSDF_PRINCIPLED'), None)
+        if bsdf:
+            mat.node_tree.links.new(normal_tex_node.outputs["Color"],
+                                    normal_map_node.inputs["Color"])
+            mat.node_tree.links.new(normal_map_node.outputs["Normal"],
+                                    bsdf.inputs["Normal"])
+    _pending_normal_maps.clear()
+    _png_saves.clear()
+
+
+def decimate_and_bake(obj, meta, meshopt=None, bake_image=None, save_png=None,
+                      simplified=None):
     """
     Conditionally decimate mesh and bake normal map based on config flags.
     All parameters come from module-level constants parsed from CLI args.
+    meta is the object's (base_name, diffuse_texture) from build_object_meta().
+    meshopt is the ctypes meshoptimizer library, or None to use the modifier.
+    bake_image is the shared NORMAL_MAP_RES bake buffer reused by every object.
+    save_png submits a background PNG encode (None saves synchronously).
+    simplified is this mesh's prefetched meshoptimizer result, if any.
     """
     if obj.type != 'MESH':
         return
 
-    base_name        = os.path.splitext(obj.name.rsplit('.', 1)[0])[0]
-    diffuse_texture  = find_texture(base_name, TEXTURE_DIR)
+    base_name, diffuse_texture = meta
+
+    # Copy the undecimated mesh as the bake source; this must happen before
+    # decimation or the "high-poly" is the low-poly
+    high_poly_obj = None
+    if BAKE_NORMALS:
+        high_poly_mesh = obj.data.copy()
+        high_poly_obj  = bpy.data.objects.new(f"{obj.name}_highpoly", high_poly_mesh)
+        bpy.context.collection.objects.link(high_poly_obj)
+        high_poly_obj.matrix_world = obj.matrix_world.copy()
 
     # ── Decimation ────────────────────────────────────────────────
-    if ENABLE_DECIMATION:
+    if ENABLE_DECIMATION and meshopt is not None:
+        meshopt_decimate(meshopt, obj, simplified)
+        print(f"  Decimated {obj.name} with meshoptimizer (ratio={DECIMATE_RATIO})")
+    elif ENABLE_DECIMATION:
         bpy.context.view_layer.objects.active = obj
         obj.select_set(True)
         modifier = obj.modifiers.new(name="Decimate", type='DECIMATE')
@@ -90,23 +541,20 @@ def decimate_and_bake(obj):
         print(f"  Decimation skipped for {obj.name} (disabled in config)")
 
     # ── Normal Baking ─────────────────────────────────────────────
-    if not ENABLE_BAKING:
-        print(f"  Normal baking skipped for {obj.name} (disabled in config)")
+    if not BAKE_NORMALS:
+        if ENABLE_BAKING:
+            print(f"  Normal baking skipped for {obj.name} (no decimation to bake from)")
+        else:
+            print(f"  Normal baking skipped for {obj.name} (disabled in config)")
         # Still apply a material with the diffuse texture even without baking
         if diffuse_texture:
-            create_normal_bake_material(obj, diffuse_texture)
+            shared_diffuse_material(obj, diffuse_texture)
         return
 
-    # Store original high-poly mesh
-    high_poly_mesh = obj.data.copy()
-    high_poly_obj  = bpy.data.objects.new(f"{obj.name}_highpoly", high_poly_mesh)
-    bpy.context.collection.objects.link(high_poly_obj)
-    high_poly_obj.location      = obj.location
-    high_poly_obj.rotation_euler = obj.rotation_euler
-    high_poly_obj.scale         = obj.scale
-
+    # The low-poly material gets per-object bake/normal nodes; the high-poly
+    # source is only ray-cast, so it can share the diffuse material
     create_normal_bake_material(obj, diffuse_texture)
-    create_normal_bake_material(high_poly_obj, diffuse_texture)
+    shared_diffuse_material(high_poly_obj, diffuse_texture)
 
     # Ensure UV map exists on low-poly
     bpy.context.view_layer.objects.active = obj
@@ -114,20 +562,13 @@ def decimate_and_bake(obj):
     if not obj.data.uv_layers:
         bpy.ops.mesh.uv_texture_add()
 
-    # BUG FIX: resolution was hardcoded to 2048; now uses NORMAL_MAP_RES from config
     normal_map_name = f"{base_name}_normal"
-    normal_img = bpy.data.images.new(
-        normal_map_name,
-        width=NORMAL_MAP_RES,
-        height=NORMAL_MAP_RES,
-        alpha=False
-    )
 
     mat   = obj.data.materials[0]
     nodes = mat.node_tree.nodes
 
     bake_node       = nodes.new("ShaderNodeTexImage")
-    bake_node.image = normal_img
+    bake_node.image = bake_image
     bake_node.name  = "BakeTarget"
     nodes.active    = bake_node
 
@@ -137,37 +578,21 @@ def decimate_and_bake(obj):
     bpy.context.view_layer.objects.active = obj
 
     try:
-        bpy.context.scene.render.engine = 'CYCLES'
-        bpy.context.scene.cycles.bake_type = 'NORMAL'
-        bpy.context.scene.render.bake.use_selected_to_active = True
-
-        # BUG FIX: were hardcoded to 0.1 / 1.0; now use values from config via CLI
-        bpy.context.scene.render.bake.cage_extrusion    = CAGE_EXTRUSION
-        bpy.context.scene.render.bake.max_ray_distance  = MAX_RAY_DISTANCE
+        bpy.ops.object.bake(type='NORMAL', use_clear=True)
 
-        bpy.ops.object.bake(type='NORMAL')
-
-        normal_map_path            = os.path.join(TEXTURE_DIR, f"{normal_map_name}.png")
-        normal_img.filepath_raw    = normal_map_path
-        normal_img.file_format     = 'PNG'
-        normal_img.save()
+        normal_map_path = os.path.join(TEXTURE_DIR, f"{normal_map_name}.png")
+        future = save_normal_map(bake_image, normal_map_path, save_png)
         print(f"  Baked normal map: {normal_map_path}")
 
-        # Wire normal map into the material
-        normal_map_node  = nodes.new("ShaderNodeNormalMap")
-        normal_tex_node  = nodes.new("ShaderNodeTexImage")
-        normal_tex_node.image = normal_img
-
-        bsdf = next((n for n in nodes if n.type == 'BSDF_PRINCIPLED'), None)
-        if bsdf:
-            mat.node_tree.links.new(normal_tex_node.outputs["Color"],
-                                    normal_map_node.inputs["Color"])
-            mat.node_tree.links.new(normal_map_node.outputs["Normal"],
-                                    bsdf.inputs["Normal"])
+        # The bake buffer is overwritten by the next object and the PNG may
+        # still be encoding, so the saved file is wired in after the loop
+        _pending_normal_maps.append((mat, normal_map_path, future))
 
     except Exception as e:
         print(f"WARNING: Failed to bake normal map for {obj.name}: {e}")
 
+    nodes.remove(bake_node)
+
     # BUG FIX: was always removing high-poly; now respects removeHighPolyAfterBake config
     if REMOVE_HIGH_POLY:
         bpy.data.objects.remove(high_poly_obj)
@@ -177,6 +602,23 @@ def decimate_and_bake(obj):
         print(f"  Kept high-poly mesh for {obj.name} (removeHighPolyAfterBake=false)")
 
 
+def save_batch_blend(blend_path):
+    """
+    Write the exported (selected) objects to a .blend next to the FBX so the
+    final merge can append them without reparsing FBX. Parents are cleared
+    with transforms kept, matching what the selection-only FBX export wrote.
+    """
+    objects = set(bpy.context.selected_objects)
+    for obj in objects:
+        if obj.parent is not None and obj.parent not in objects:
+            matrix = obj.matrix_world.copy()
+            obj.parent = None
+            obj.matrix_world = matrix
+
+    print(f"Saving {blend_path}")
+    bpy.data.libraries.write(blend_path, objects, path_remap='ABSOLUTE', compress=False)
+
+
 def main():
     print(f"Processing {len(GLTF_FILES)} GLTF files")
     print(f"Decimate ratio:        {DECIMATE_RATIO}  (enabled={ENABLE_DECIMATION})")
@@ -184,9 +626,17 @@ def main():
     print(f"Cage extrusion:        {CAGE_EXTRUSION}")
     print(f"Max ray distance:      {MAX_RAY_DISTANCE}")
     print(f"Remove high-poly:      {REMOVE_HIGH_POLY}")
+    print(f"Save batch .blend:     {SAVE_BATCH_BLEND}")
     print(f"Output: {OUTPUT_FBX}")
 
+    meshopt = load_meshoptimizer() if ENABLE_DECIMATION else None
+    if ENABLE_DECIMATION:
+        print(f"Decimator:             {'meshoptimizer' if meshopt else 'DECIMATE modifier'}")
+
     reset_scene()
+    if BAKE_NORMALS:
+        configure_cycles_device()
+        configure_bake_settings()
 
     # Import all GLTF files
     imported_count = 0
@@ -203,20 +653,65 @@ def main():
     print(f"Found {len(mesh_objects)} mesh objects")
 
     if os.path.exists(TEXTURE_DIR):
-        for idx, obj in enumerate(mesh_objects, 1):
-            print(f"Processing {idx}/{len(mesh_objects)}: {obj.name}")
-            decimate_and_bake(obj)
+        # One directory scan instead of up to three stats per mesh
+        texture_index = build_texture_index(TEXTURE_DIR)
+        obj_meta      = build_object_meta(mesh_objects, texture_index)
+
+        # BUG FIX: resolution was hardcoded to 2048; now uses NORMAL_MAP_RES from config
+        # One bake buffer for the whole batch instead of a fresh image per object
+        bake_image = None
+        if BAKE_NORMALS and mesh_objects:
+            bake_image = bpy.data.images.new(
+                "NormalBakeTarget",
+                width=NORMAL_MAP_RES,
+                height=NORMAL_MAP_RES,
+                alpha=False
+            )
+
+        # PNG encoding overlaps the next object's bake when an encoder exists
+        encode_png = load_png_encoder() if bake_image else None
+        png_saver  = ThreadPoolExecutor(max_workers=PNG_SAVE_WORKERS) if encode_png else None
+        save_png   = partial(png_saver.submit, encode_png) if png_saver else None
+
+        # meshoptimizer simplifies the next mesh on a worker while this one bakes
+        prefetcher = ThreadPoolExecutor(max_workers=1) if meshopt else None
+        pending    = None
+        if prefetcher and mesh_objects:
+            pending = prefetch_decimation(prefetcher, meshopt, mesh_objects[0])
+
+        try:
+            for idx, obj in enumerate(mesh_objects, 1):
+                print(f"Processing {idx}/{len(mesh_objects)}: {obj.name}")
+                simplified, pending = pending, None
+                if prefetcher and idx < len(mesh_objects):
+                    pending = prefetch_decimation(prefetcher, meshopt, mesh_objects[idx])
+                decimate_and_bake(obj, obj_meta[obj], meshopt, bake_image, save_png,
+                                  simplified)
+        finally:
+            if prefetcher:
+                prefetcher.shutdown(wait=True)
+            if png_saver:
+                png_saver.shutdown(wait=True)
+        attach_normal_maps()
+
+        if bake_image:
+            bpy.data.images.remove(bake_image)
     else:
         print(f"WARNING: Texture directory not found: {TEXTURE_DIR}")
 
+    # Drop data left without users by the bake loop (replaced materials,
+    # removed high-poly meshes) so it is not held through join and export
+    bpy.ops.outliner.orphans_purge(do_recursive=True)
+
     # Select all meshes and join
     bpy.ops.object.select_all(action='DESELECT')
     mesh_objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
     for obj in mesh_objects:
         obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
 
     if mesh_objects:
+        # Set the join target once rather than on every loop iteration
+        bpy.context.view_layer.objects.active = mesh_objects[-1]
         print("Joining all meshes...")
         bpy.ops.object.join()
 
@@ -234,6 +729,9 @@ def main():
         embed_textures=True
     )
 
+    if SAVE_BATCH_BLEND:
+        save_batch_blend(os.path.splitext(OUTPUT_FBX)[0] + ".blend")
+
     print("Done!")
 
 
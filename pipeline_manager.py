@@ -5,16 +5,25 @@ A full-featured GUI for managing the GLTF-to-FBX pipeline configuration and exec
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import codecs
 import json
 import os
+import re
 import sys
 import subprocess
 import threading
-import queue
 import time
-import copy
+from collections import deque
 from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
+
+# Optional: watchdog lets the Batch Monitor react to filesystem events
+# (inotify / ReadDirectoryChangesW); without it, Watch falls back to polling
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
 
 # ─────────────────────────────────────────────
 #  WINDOWS: DPI AWARENESS + DEDICATED GPU
@@ -39,10 +48,16 @@ if sys.platform == "win32":
         import winreg
         _exe = sys.executable
         _key_path = r"SOFTWARE\Microsoft\DirectX\UserGpuPreferences"
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, _key_path,
-                            0, winreg.KEY_SET_VALUE) as _k:
-            winreg.SetValueEx(_k, _exe, 0, winreg.REG_SZ,
-                              "GpuPreference=2;")   # 2 = High Performance GPU
+        _gpu_pref = "GpuPreference=2;"   # 2 = High Performance GPU
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, _key_path, 0,
+                            winreg.KEY_QUERY_VALUE | winreg.KEY_SET_VALUE) as _k:
+            # Only write when missing or different; most launches just read
+            try:
+                _current, _ = winreg.QueryValueEx(_k, _exe)
+            except OSError:
+                _current = None
+            if _current != _gpu_pref:
+                winreg.SetValueEx(_k, _exe, 0, winreg.REG_SZ, _gpu_pref)
     except Exception:
         pass   # non-fatal: app still works on integrated GPU
 
@@ -72,6 +87,42 @@ CONSOLE_FG     = "#a8ff78"
 FONT_FAMILY    = "Segoe UI"
 FONT_MONO      = "Consolas"
 
+# Console poll interval (ms): POLL_MIN_MS while output flows, doubling to POLL_MAX_MS when idle
+POLL_MIN_MS    = 50
+POLL_MAX_MS    = 500
+
+# Batch Monitor watch: the UI thread checks for filesystem events every
+# WATCH_TICK_MS and refreshes once they have been quiet for WATCH_DEBOUNCE_S,
+# but never waits longer than WATCH_MAX_WAIT_S under a steady stream (the
+# batch logs are written into the watched folder). Without watchdog it
+# re-scans every WATCH_POLL_S instead.
+WATCH_TICK_MS    = 200
+WATCH_DEBOUNCE_S = 0.2
+WATCH_MAX_WAIT_S = 2.5
+WATCH_POLL_S     = 3.0
+
+# Pipeline run state -> (status label text, dot/label colour)
+_RUN_STATUS = {
+    "IDLE":     ("IDLE",     TEXT_DIM),
+    "RUNNING":  ("RUNNING",  SUCCESS),
+    "COMPLETE": ("COMPLETE", SUCCESS),
+    "FAILED":   ("FAILED",   ERROR),
+}
+
+# Bytes per os.read() on the pipeline's stdout pipe
+READ_CHUNK_SIZE = 64 * 1024
+# One output line with its terminator; only \r\n, \r and \n end a line, as
+# with text-mode readline (str.splitlines also breaks on \x0b, \x1c, U+2028...)
+_LINE_RE = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)")
+
+# Console keeps the newest CONSOLE_MAX_LINES lines; trimmed in one delete once
+# it grows CONSOLE_TRIM_SLACK past that
+CONSOLE_MAX_LINES  = 10_000
+CONSOLE_TRIM_SLACK = 1_000
+
+# Lines per Text.get() slice when saving the console to disk
+SAVE_LOG_CHUNK_LINES = 4096
+
 
 # ─────────────────────────────────────────────
 #  DEFAULT CONFIG TEMPLATE
@@ -99,6 +150,7 @@ DEFAULT_CONFIG = {
     },
     "processing": {
         "maxParallelBlenderInstances": 32,
+        "finalMergeImportWorkers": 4,
         "processCheckIntervalMs": 200,
         "defaultFilesPerBatch": 10,
         "defaultDecimateRatio": 0.5,
@@ -115,7 +167,8 @@ DEFAULT_CONFIG = {
         "cleanOutputFolders": False,
         "verboseLogging": True,
         "saveBatchLogs": True,
-        "removeHighPolyAfterBake": True
+        "removeHighPolyAfterBake": True,
+        "saveBatchBlend": True
     },
     "quality": {
         "presets": {
@@ -132,23 +185,195 @@ DEFAULT_CONFIG = {
 # ─────────────────────────────────────────────
 #  UTILITIES
 # ─────────────────────────────────────────────
+# json.dumps settings: compact for in-memory clones; config files stay indented
+# for hand editing and keep ASCII escapes, because Windows PowerShell 5.1's
+# Get-Content (used by the .ps1 scripts) reads BOM-less files as ANSI
+_COMPACT_DUMP_KW = {"separators": (",", ":"), "ensure_ascii": False}
+_DUMP_KW         = {"indent": 2, "ensure_ascii": True}
+
+# DEFAULT_CONFIG pre-serialised once (compact UTF-8); cloning it is then a
+# single json.loads
+_DEFAULT_CONFIG_BLOB = json.dumps(DEFAULT_CONFIG, **_COMPACT_DUMP_KW).encode()
+
+
+def _fast_clone(d: dict) -> dict:
+    """Deep copy of JSON-shaped data; much cheaper than copy.deepcopy here."""
+    if d is DEFAULT_CONFIG:
+        return json.loads(_DEFAULT_CONFIG_BLOB)
+    return json.loads(json.dumps(d, **_COMPACT_DUMP_KW))
+
+
+# Config files keyed by path -> (st_mtime_ns, st_size, compact JSON text).
+# The cache holds the re-serialised blob rather than the parsed dict, because
+# deep_merge puts override subtrees into current_config by reference; every
+# caller gets a fresh tree from one json.loads, like _DEFAULT_CONFIG_BLOB
+_CFG_CACHE = {}
+
+
+def _read_config_file(path: str) -> dict:
+    """json.load a config file, reusing the last parse while it is unchanged."""
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _CFG_CACHE.get(path)
+    if hit is not None and hit[:2] == key:
+        return json.loads(hit[2])
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    # Kept as str: with ensure_ascii off, a lone surrogate (an undecodable
+    # Windows filename) would make a UTF-8 encode raise
+    _CFG_CACHE[path] = key + (json.dumps(raw, **_COMPACT_DUMP_KW),)
+    return raw
+
+
 def deep_merge(base: dict, override: dict) -> dict:
-    result = copy.deepcopy(base)
-    for k, v in override.items():
-        if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-            result[k] = deep_merge(result[k], v)
-        else:
-            result[k] = v
+    result = _fast_clone(base)
+    _merge_into(result, override)
     return result
 
 
+def _merge_into(dst: dict, src: dict):
+    """Recursively merge src into dst in place (dst is already a private copy)."""
+    for k, v in src.items():
+        cur = dst.get(k)
+        if cur.__class__ is dict and v.__class__ is dict:
+            _merge_into(cur, v)
+        else:
+            dst[k] = v
+
+
+def _to_int(raw) -> int:
+    return int(raw) if raw != "" else 0
+
+
+def _to_float(raw) -> float:
+    return float(raw) if raw != "" else 0.0
+
+
+# Exact Tk variable class -> converter used when collecting config values;
+# looked up with type(var), so unknown variable classes fall back to str
+_VAR_CONVERTERS = {
+    tk.BooleanVar: bool,
+    tk.IntVar:     _to_int,
+    tk.DoubleVar:  _to_float,
+    tk.StringVar:  str,
+}
+
+
+# Console line classification: keywords per tag, checked case-insensitively.
+# When several tags match, the lowest _CLASSIFY_PRIORITY value wins.
+_CLASSIFY_RE = re.compile(
+    r"(?P<error>error|failed|exception|traceback|exit code)"
+    r"|(?P<warning>warning|warn|not found|skipped)"
+    r"|(?P<success>done|complete|success|finished|merged)"
+    r"|(?P<info>step|starting|processing|importing|exporting)",
+    re.IGNORECASE)
+_CLASSIFY_PRIORITY = {"error": 0, "warning": 1, "success": 2, "info": 3}
+
+
+_BANNER    = "=" * 60
+_TIMER_FMT = "%H:%M:%S"
+
+
 def now_str() -> str:
     return datetime.now().strftime("%H:%M:%S")
 
 
+def _fmt_elapsed(seconds: float) -> str:
+    """HH:MM:SS for a duration; hours keep counting past a day."""
+    secs = int(seconds)
+    if secs < 86400:
+        return time.strftime(_TIMER_FMT, time.gmtime(secs))
+    return f"{secs // 3600:02d}:{secs % 3600 // 60:02d}:{secs % 60:02d}"
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _fmt_size(n: int) -> str:
+    """Human-readable byte count; the unit comes from the bit length."""
+    u = min(max((n.bit_length() - 1) // 10, 0), 4)
+    if u == 0:
+        return f"{n} B"
+    return f"{n / (1 << (10 * u)):.2f} {_SIZE_UNITS[u]}"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_mtime(mtime_ns: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime_ns // 1_000_000_000))
+
+
+def _validate_numeric(value: str, float_mode: str) -> bool:
+    """Tk validatecommand shared by every NumericEntry (float_mode is "0"/"1")."""
+    if value == "" or value == "-":
+        return True
+    try:
+        float(value) if float_mode == "1" else int(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _numeric_vcmd(widget, float_mode: bool) -> tuple:
+    """validatecommand tuple; the Tcl command is registered once per Tk root."""
+    root = widget._root()
+    cmd = getattr(root, "_num_validate", None)
+    if cmd is None:
+        cmd = root._num_validate = root.register(_validate_numeric)
+    return (cmd, "%P", int(float_mode))
+
+
+_styles_done = False
+
+
+def _configure_styles(root):
+    """Configure every ttk style the app uses; later calls are no-ops."""
+    global _styles_done
+    if _styles_done:
+        return
+    _styles_done = True
+
+    style = ttk.Style(root)
+    style.theme_use("default")
+    style.configure("TNotebook", background=DARK_BG, borderwidth=0)
+    style.configure("TNotebook.Tab",
+                     background=SIDEBAR_BG, foreground=TEXT_DIM,
+                     padding=(16, 8), font=(FONT_FAMILY, 10))
+    style.map("TNotebook.Tab",
+               background=[("selected", PANEL_BG)],
+               foreground=[("selected", TEXT_PRIMARY)])
+    style.configure("Vertical.TScrollbar",
+                     troughcolor=DARK_BG, background=INPUT_BORDER,
+                     arrowcolor=TEXT_DIM, borderwidth=0)
+    style.configure("Pipeline.Horizontal.TProgressbar",
+                     troughcolor=INPUT_BG, background=ACCENT,
+                     darkcolor=ACCENT, lightcolor=ACCENT,
+                     bordercolor=DARK_BG, thickness=6)
+    style.configure("Monitor.Treeview",
+                     background=INPUT_BG, foreground=TEXT_PRIMARY,
+                     fieldbackground=INPUT_BG, bordercolor=BORDER,
+                     rowheight=24, font=(FONT_FAMILY, 9))
+    style.configure("Monitor.Treeview.Heading",
+                     background=SIDEBAR_BG, foreground=ACCENT,
+                     font=(FONT_FAMILY, 9, "bold"), relief="flat")
+    style.map("Monitor.Treeview", background=[("selected", ACCENT_DARK)])
+
+
 # ─────────────────────────────────────────────
 #  STYLED WIDGETS
 # ─────────────────────────────────────────────
+# Shared look of every themed text entry; only parent/var/width vary
+_ENTRY_KW = {
+    "bg": INPUT_BG, "fg": TEXT_PRIMARY, "insertbackground": TEXT_PRIMARY,
+    "relief": "flat", "bd": 0, "highlightthickness": 1,
+    "highlightbackground": INPUT_BORDER, "highlightcolor": ACCENT,
+    "font": (FONT_FAMILY, 9),
+}
+
+
+def _make_entry(parent, var, width, **kwargs) -> tk.Entry:
+    return tk.Entry(parent, textvariable=var, width=width, **_ENTRY_KW, **kwargs)
+
+
 class StyledButton(tk.Button):
     def __init__(self, parent, text="", command=None, style="primary",
                  width=None, **kwargs):
@@ -185,23 +410,22 @@ class LabeledEntry(tk.Frame):
         super().__init__(parent, bg=PANEL_BG, **kwargs)
         tk.Label(self, text=label, bg=PANEL_BG, fg=TEXT_SECONDARY,
                  font=(FONT_FAMILY, 9), anchor="w", width=26).pack(side="left")
-        entry = tk.Entry(self, textvariable=var,
-                         bg=INPUT_BG, fg=TEXT_PRIMARY, insertbackground=TEXT_PRIMARY,
-                         relief="flat", bd=0, highlightthickness=1,
-                         highlightbackground=INPUT_BORDER, highlightcolor=ACCENT,
-                         font=(FONT_FAMILY, 9), width=40)
+        entry = _make_entry(self, var, 40)
         entry.pack(side="left", padx=(0, 6), ipady=4)
+        self._var = var
+        self._browse_dir = browse_dir
         if browse:
-            def do_browse():
-                if browse_dir:
-                    p = filedialog.askdirectory()
-                else:
-                    p = filedialog.askopenfilename()
-                if p:
-                    var.set(p)
-            StyledButton(self, "Browse", do_browse, style="ghost",
+            StyledButton(self, "Browse", self._browse, style="ghost",
                          font=(FONT_FAMILY, 8)).pack(side="left")
 
+    def _browse(self):
+        if self._browse_dir:
+            p = filedialog.askdirectory()
+        else:
+            p = filedialog.askopenfilename()
+        if p:
+            self._var.set(p)
+
 
 class SectionHeader(tk.Label):
     def __init__(self, parent, text, **kwargs):
@@ -239,13 +463,9 @@ class NumericEntry(tk.Frame):
 
         tk.Label(self, text=label, bg=PANEL_BG, fg=TEXT_SECONDARY,
                  font=(FONT_FAMILY, 9), anchor="w", width=26).pack(side="left")
-        vcmd = (self.register(self._validate), "%P")
-        self.entry = tk.Entry(self, textvariable=var,
-                              validate="key", validatecommand=vcmd,
-                              bg=INPUT_BG, fg=TEXT_PRIMARY, insertbackground=TEXT_PRIMARY,
-                              relief="flat", bd=0, highlightthickness=1,
-                              highlightbackground=INPUT_BORDER, highlightcolor=ACCENT,
-                              font=(FONT_FAMILY, 9), width=width)
+        vcmd = _numeric_vcmd(self, float_mode)
+        self.entry = _make_entry(self, var, width,
+                                  validate="key", validatecommand=vcmd)
         self.entry.pack(side="left", ipady=4, padx=(0, 4))
         hint = ""
         if min_val is not None and max_val is not None:
@@ -254,15 +474,6 @@ class NumericEntry(tk.Frame):
             tk.Label(self, text=hint, bg=PANEL_BG, fg=TEXT_DIM,
                      font=(FONT_FAMILY, 8)).pack(side="left")
 
-    def _validate(self, value):
-        if value == "" or value == "-":
-            return True
-        try:
-            float(value) if self.float_mode else int(value)
-            return True
-        except ValueError:
-            return False
-
 
 # ─────────────────────────────────────────────
 #  CONFIG EDITOR PANEL
@@ -271,8 +482,23 @@ class ConfigPanel(tk.Frame):
     def __init__(self, parent, app, **kwargs):
         super().__init__(parent, bg=PANEL_BG, **kwargs)
         self.app = app
-        self._vars = {}
+        self._fields = []   # (key tuple, var, converter) while _build registers
+        self._var_paths = ()
+        # Widgets are built the first time the tab is mapped; until then
+        # load_from_config() just remembers the config to apply
+        self._built = False
+        self._pending_cfg = None
+        self.bind("<Map>", self._on_first_map)
+
+    def _on_first_map(self, _event=None):
+        if self._built:
+            return
+        self._built = True
+        self.unbind("<Map>")
         self._build()
+        if self._pending_cfg is not None:
+            cfg, self._pending_cfg = self._pending_cfg, None
+            self.load_from_config(cfg)
 
     def _build(self):
         # Scrollable canvas
@@ -293,21 +519,9 @@ class ConfigPanel(tk.Frame):
         inner.bind("<Configure>", _on_frame_configure)
         canvas.bind("<Configure>", _on_canvas_configure)
 
-        def _scroll(e):
-            # Fires exactly once per physical scroll tick via bind_all
-            canvas.yview_scroll(-1 * (e.delta // 120), "units")
-
-        def _enable_scroll(e):
-            canvas.bind_all("<MouseWheel>", _scroll)
-
-        def _disable_scroll(e):
-            canvas.unbind_all("<MouseWheel>")
-
-        # Only capture scroll events while the mouse is inside this panel
-        canvas.bind("<Enter>", _enable_scroll)
-        canvas.bind("<Leave>", _disable_scroll)
-        inner.bind("<Enter>", _enable_scroll)
-        inner.bind("<Leave>", _disable_scroll)
+        # The app's single <MouseWheel> handler scrolls the marked canvas
+        # whenever the pointer is over it or any of its children
+        canvas._is_scrollable = True
 
         # Two pack-kwargs variants: section headers get extra top padding, rows get standard
         pad     = {"padx": 16, "pady": 3,       "fill": "x"}   # regular rows
@@ -317,10 +531,10 @@ class ConfigPanel(tk.Frame):
         SectionHeader(inner, "📁  Paths").pack(**{**sec_pad, "pady": (12, 2)})
         Separator(inner).pack(fill="x", padx=16, pady=(0, 8))
 
-        v = tk.StringVar(); self._vars["paths.projectRoot"] = v
+        v = self._register("paths.projectRoot", tk.StringVar())
         LabeledEntry(inner, "Project Root", v, browse=True, browse_dir=True).pack(**pad)
 
-        v = tk.StringVar(); self._vars["paths.blenderExecutable"] = v
+        v = self._register("paths.blenderExecutable", tk.StringVar())
         LabeledEntry(inner, "Blender Executable", v, browse=True).pack(**pad)
 
         # ── Folders ────────────────────────────
@@ -335,7 +549,7 @@ class ConfigPanel(tk.Frame):
             ("mergedOutput",      "Merged Output Folder"),
         ]
         for key, label in folder_fields:
-            v = tk.StringVar(); self._vars[f"folders.{key}"] = v
+            v = self._register(f"folders.{key}", tk.StringVar())
             LabeledEntry(inner, label, v).pack(**pad)
 
         # ── Scripts ────────────────────────────
@@ -349,54 +563,57 @@ class ConfigPanel(tk.Frame):
             ("runFullPipeline",         "Full Pipeline Script"),
         ]
         for key, label in script_fields:
-            v = tk.StringVar(); self._vars[f"scripts.{key}"] = v
+            v = self._register(f"scripts.{key}", tk.StringVar())
             LabeledEntry(inner, label, v).pack(**pad)
 
         # ── Output ─────────────────────────────
         SectionHeader(inner, "💾  Output Settings").pack(**sec_pad)
         Separator(inner).pack(fill="x", padx=16, pady=(0, 8))
 
-        v = tk.StringVar(); self._vars["output.mergedFbxName"] = v
+        v = self._register("output.mergedFbxName", tk.StringVar())
         LabeledEntry(inner, "Merged FBX Name", v).pack(**pad)
 
         # ── Processing ─────────────────────────
         SectionHeader(inner, "⚙️  Processing").pack(**sec_pad)
         Separator(inner).pack(fill="x", padx=16, pady=(0, 8))
 
-        v = tk.IntVar(); self._vars["processing.maxParallelBlenderInstances"] = v
+        v = self._register("processing.maxParallelBlenderInstances", tk.IntVar())
         NumericEntry(inner, "Max Parallel Instances", v, 1, 64).pack(**pad)
 
-        v = tk.IntVar(); self._vars["processing.processCheckIntervalMs"] = v
+        v = self._register("processing.finalMergeImportWorkers", tk.IntVar())
+        NumericEntry(inner, "Final Merge Import Workers", v, 1, 64).pack(**pad)
+
+        v = self._register("processing.processCheckIntervalMs", tk.IntVar())
         NumericEntry(inner, "Process Check Interval (ms)", v, 50, 5000).pack(**pad)
 
-        v = tk.IntVar(); self._vars["processing.defaultFilesPerBatch"] = v
+        v = self._register("processing.defaultFilesPerBatch", tk.IntVar())
         NumericEntry(inner, "Default Files Per Batch", v, 1, 200).pack(**pad)
 
-        v = tk.DoubleVar(); self._vars["processing.defaultDecimateRatio"] = v
+        v = self._register("processing.defaultDecimateRatio", tk.DoubleVar())
         NumericEntry(inner, "Default Decimate Ratio", v, 0.01, 1.0,
                      float_mode=True, width=8).pack(**pad)
 
-        v = tk.BooleanVar(); self._vars["processing.cleanupSubfolders"] = v
+        v = self._register("processing.cleanupSubfolders", tk.BooleanVar())
         ToggleSwitch(inner, "Clean Up Empty Subfolders After Consolidation", v).pack(**pad)
 
         # ── Optimization ───────────────────────
         SectionHeader(inner, "🔧  Optimization").pack(**sec_pad)
         Separator(inner).pack(fill="x", padx=16, pady=(0, 8))
 
-        v = tk.BooleanVar(); self._vars["optimization.enableDecimation"] = v
+        v = self._register("optimization.enableDecimation", tk.BooleanVar())
         ToggleSwitch(inner, "Enable Mesh Decimation", v).pack(**pad)
 
-        v = tk.BooleanVar(); self._vars["optimization.enableNormalBaking"] = v
+        v = self._register("optimization.enableNormalBaking", tk.BooleanVar())
         ToggleSwitch(inner, "Enable Normal Map Baking", v).pack(**pad)
 
-        v = tk.IntVar(); self._vars["optimization.normalMapResolution"] = v
+        v = self._register("optimization.normalMapResolution", tk.IntVar())
         NumericEntry(inner, "Normal Map Resolution (px)", v, 256, 8192).pack(**pad)
 
-        v = tk.DoubleVar(); self._vars["optimization.bakeCageExtrusion"] = v
+        v = self._register("optimization.bakeCageExtrusion", tk.DoubleVar())
         NumericEntry(inner, "Bake Cage Extrusion", v, 0.0, 10.0,
                      float_mode=True, width=8).pack(**pad)
 
-        v = tk.DoubleVar(); self._vars["optimization.bakeMaxRayDistance"] = v
+        v = self._register("optimization.bakeMaxRayDistance", tk.DoubleVar())
         NumericEntry(inner, "Bake Max Ray Distance", v, 0.0, 100.0,
                      float_mode=True, width=8).pack(**pad)
 
@@ -409,9 +626,10 @@ class ConfigPanel(tk.Frame):
             ("options.verboseLogging",         "Verbose Logging"),
             ("options.saveBatchLogs",          "Save Batch Log Files"),
             ("options.removeHighPolyAfterBake","Remove High-Poly Mesh After Baking"),
+            ("options.saveBatchBlend",         "Save Batch .blend for Final Merge"),
         ]
         for key, label in bool_options:
-            v = tk.BooleanVar(); self._vars[key] = v
+            v = self._register(key, tk.BooleanVar())
             ToggleSwitch(inner, label, v).pack(**pad)
 
         # ── Quality Presets ────────────────────
@@ -436,59 +654,54 @@ class ConfigPanel(tk.Frame):
                 tk.Label(row, text=sub_label + ":", bg=PANEL_BG, fg=TEXT_DIM,
                          font=(FONT_FAMILY, 8)).pack(side="left", padx=(8, 2))
                 var_key = f"quality.presets.{preset}.{sub_key}"
-                v = tk.DoubleVar() if fm else tk.IntVar()
-                self._vars[var_key] = v
-                e = tk.Entry(row, textvariable=v,
-                             bg=INPUT_BG, fg=TEXT_PRIMARY, insertbackground=TEXT_PRIMARY,
-                             relief="flat", bd=0, highlightthickness=1,
-                             highlightbackground=INPUT_BORDER, highlightcolor=ACCENT,
-                             font=(FONT_FAMILY, 9), width=w)
+                v = self._register(var_key, tk.DoubleVar() if fm else tk.IntVar())
+                e = _make_entry(row, v, w)
                 e.pack(side="left", ipady=3)
 
         # ── Bottom Padding ─────────────────────
         tk.Frame(inner, bg=PANEL_BG, height=20).pack()
 
+        # The variable set is fixed from here on: freeze it into the tuple that
+        # load/collect iterate and drop the build-time list
+        self._var_paths = tuple(self._fields)
+        self._fields = None
+
+    def _register(self, path: str, var):
+        """Track a config variable with its split key path and value converter."""
+        convert = _VAR_CONVERTERS.get(type(var), str)
+        self._fields.append((tuple(path.split(".")), var, convert))
+        var.trace_add("write", self.app.mark_config_dirty)
+        return var
+
     def load_from_config(self, cfg: dict):
         """Populate all widgets from a config dict."""
-        def _set(key_path, value):
-            if key_path in self._vars:
-                try:
-                    self._vars[key_path].set(value)
-                except Exception:
-                    pass
-
-        def _walk(d, prefix=""):
-            for k, v in d.items():
-                full = f"{prefix}.{k}" if prefix else k
-                if isinstance(v, dict):
-                    _walk(v, full)
-                else:
-                    _set(full, v)
-
-        _walk(cfg)
+        if not self._built:
+            self._pending_cfg = cfg
+            return
+        for keys, var, _ in self._var_paths:
+            try:
+                d = cfg
+                for key in keys[:-1]:
+                    d = d[key]
+                var.set(d[keys[-1]])
+            except Exception:
+                pass
 
     def collect_config(self) -> dict:
         """Build config dict from all widget values."""
-        cfg = copy.deepcopy(DEFAULT_CONFIG)
+        if not self._built:
+            # Nothing can have been edited yet; return what was loaded
+            return deep_merge(DEFAULT_CONFIG, self._pending_cfg or {})
+        cfg = _fast_clone(DEFAULT_CONFIG)
 
         def _set_nested(d, keys, value):
             for key in keys[:-1]:
                 d = d.setdefault(key, {})
             d[keys[-1]] = value
 
-        for key_path, var in self._vars.items():
+        for keys, var, convert in self._var_paths:
             try:
-                raw = var.get()
-                # Convert types
-                if isinstance(var, tk.BooleanVar):
-                    value = bool(raw)
-                elif isinstance(var, tk.IntVar):
-                    value = int(raw) if raw != "" else 0
-                elif isinstance(var, tk.DoubleVar):
-                    value = float(raw) if raw != "" else 0.0
-                else:
-                    value = str(raw)
-                _set_nested(cfg, key_path.split("."), value)
+                _set_nested(cfg, keys, convert(var.get()))
             except Exception:
                 pass
 
@@ -505,13 +718,27 @@ class PipelinePanel(tk.Frame):
         self._process = None
         self._thread = None
         self._reader_thread = None
-        self._log_queue = queue.Queue()
+        # Reader thread -> Tk: deque append/popleft are atomic, so no lock per
+        # line; the event tells the poller something arrived since its last drain
+        self._log_deque = deque()
+        self._log_event = threading.Event()
+        self._finished = False      # set by the worker once the process exits
+        self._poll_ms = POLL_MIN_MS
         self._running = False
         self._start_time = None
         self._timer_id = None
+        self._last_elapsed = None   # last text written to _elapsed_label
+        self._line_total = 0    # lines in the console; avoids index("end-1c")
+        # Last _build_command result and the config values it used; cleared
+        # by traces on the run-option vars so they are not re-read per run
+        self._cmd_cache = None
+        self._cmd_cfg_key = None
 
         self._build()
-        self._poll_queue()
+        for var in (self._skip_batch, self._skip_texture, self._only_merge,
+                    self._files_per_batch, self._decimate_ratio,
+                    self._config_path_var):
+            var.trace_add("write", self._invalidate_command)
 
     def _build(self):
         # ── Top bar ────────────────────────────
@@ -526,12 +753,13 @@ class PipelinePanel(tk.Frame):
         self._elapsed_label.pack(side="left", padx=12)
 
         # Status indicator
-        self._status_dot = tk.Label(topbar, text="●", bg=SIDEBAR_BG, fg=TEXT_DIM,
+        self._status_dot = tk.Label(topbar, text="●", bg=SIDEBAR_BG,
                                      font=(FONT_FAMILY, 16))
         self._status_dot.pack(side="right", padx=6)
-        self._status_label = tk.Label(topbar, text="IDLE", bg=SIDEBAR_BG, fg=TEXT_DIM,
+        self._status_label = tk.Label(topbar, bg=SIDEBAR_BG,
                                        font=(FONT_FAMILY, 9, "bold"))
         self._status_label.pack(side="right")
+        self._set_status("IDLE")
 
         # ── Options bar ────────────────────────
         opts = tk.Frame(self, bg=PANEL_BG, padx=16, pady=10)
@@ -563,20 +791,12 @@ class PipelinePanel(tk.Frame):
         tk.Label(opts, text="Files/Batch:", bg=PANEL_BG, fg=TEXT_SECONDARY,
                  font=(FONT_FAMILY, 9)).pack(side="left", padx=(0, 3))
         self._files_per_batch = tk.StringVar(value="")
-        tk.Entry(opts, textvariable=self._files_per_batch, width=5,
-                 bg=INPUT_BG, fg=TEXT_PRIMARY, insertbackground=TEXT_PRIMARY,
-                 relief="flat", bd=0, highlightthickness=1,
-                 highlightbackground=INPUT_BORDER, highlightcolor=ACCENT,
-                 font=(FONT_FAMILY, 9)).pack(side="left", ipady=3, padx=(0, 10))
+        _make_entry(opts, self._files_per_batch, 5).pack(side="left", ipady=3, padx=(0, 10))
 
         tk.Label(opts, text="Decimate:", bg=PANEL_BG, fg=TEXT_SECONDARY,
                  font=(FONT_FAMILY, 9)).pack(side="left", padx=(0, 3))
         self._decimate_ratio = tk.StringVar(value="")
-        tk.Entry(opts, textvariable=self._decimate_ratio, width=5,
-                 bg=INPUT_BG, fg=TEXT_PRIMARY, insertbackground=TEXT_PRIMARY,
-                 relief="flat", bd=0, highlightthickness=1,
-                 highlightbackground=INPUT_BORDER, highlightcolor=ACCENT,
-                 font=(FONT_FAMILY, 9)).pack(side="left", ipady=3)
+        _make_entry(opts, self._decimate_ratio, 5).pack(side="left", ipady=3)
 
         # ── Quick preset bar ───────────────────
         presets_bar = tk.Frame(self, bg=DARK_BG, padx=16, pady=6)
@@ -618,11 +838,7 @@ class PipelinePanel(tk.Frame):
         self._config_path_var = tk.StringVar(value="config.json")
         tk.Label(actions, text="Config:", bg=DARK_BG, fg=TEXT_DIM,
                  font=(FONT_FAMILY, 9)).pack(side="right", padx=(8, 3))
-        tk.Entry(actions, textvariable=self._config_path_var, width=22,
-                 bg=INPUT_BG, fg=TEXT_PRIMARY, insertbackground=TEXT_PRIMARY,
-                 relief="flat", bd=0, highlightthickness=1,
-                 highlightbackground=INPUT_BORDER, highlightcolor=ACCENT,
-                 font=(FONT_FAMILY, 9)).pack(side="right", ipady=3)
+        _make_entry(actions, self._config_path_var, 22).pack(side="right", ipady=3)
         tk.Label(actions, text="Using:", bg=DARK_BG, fg=TEXT_DIM,
                  font=(FONT_FAMILY, 8)).pack(side="right", padx=(0, 3))
 
@@ -631,12 +847,7 @@ class PipelinePanel(tk.Frame):
         prog_frame.pack(fill="x")
 
         self._progress_var = tk.DoubleVar(value=0)
-        style = ttk.Style()
-        style.theme_use("default")
-        style.configure("Pipeline.Horizontal.TProgressbar",
-                         troughcolor=INPUT_BG, background=ACCENT,
-                         darkcolor=ACCENT, lightcolor=ACCENT,
-                         bordercolor=DARK_BG, thickness=6)
+        _configure_styles(self.winfo_toplevel())
         self._progress = ttk.Progressbar(prog_frame,
                                           variable=self._progress_var,
                                           style="Pipeline.Horizontal.TProgressbar",
@@ -684,33 +895,48 @@ class PipelinePanel(tk.Frame):
 
     # ── Console Helpers ────────────────────────
     def _classify_line(self, line: str) -> str:
-        l = line.lower()
-        if any(x in l for x in ["error", "failed", "exception", "traceback", "exit code"]):
-            return "error"
-        if any(x in l for x in ["warning", "warn", "not found", "skipped"]):
-            return "warning"
-        if any(x in l for x in ["done", "complete", "success", "finished", "merged"]):
-            return "success"
-        if any(x in l for x in ["step", "starting", "processing", "importing", "exporting"]):
-            return "info"
+        # One regex pass; the highest-priority tag found wins, as before
+        best = None
+        for m in _CLASSIFY_RE.finditer(line):
+            tag = m.lastgroup
+            if tag == "error":
+                return tag
+            if best is None or _CLASSIFY_PRIORITY[tag] < _CLASSIFY_PRIORITY[best]:
+                best = tag
+        if best:
+            return best
         if line.startswith("=") or line.startswith("-"):
             return "accent"
         return "normal"
 
     def _log(self, text: str, tag: str = "normal"):
-        self._console.config(state="normal")
+        self._log_bulk([(text, tag)])
+
+    def _log_bulk(self, entries):
+        """Append (text, tag) lines with one insert, one scroll and one label update."""
+        if not entries:
+            return
+        # One timestamp per flush: every line in a batch arrived within one poll
         ts = f"[{now_str()}] "
-        self._console.insert("end", ts, "time")
-        self._console.insert("end", text + "\n", tag)
+        args = []
+        for text, tag in entries:
+            args += (ts, "time", text + "\n", tag)
+            self._line_total += text.count("\n") + 1
+        self._console.config(state="normal")
+        self._console.insert("end", *args)
+        excess = self._line_total - CONSOLE_MAX_LINES
+        if excess > CONSOLE_TRIM_SLACK:
+            self._console.delete("1.0", f"{excess + 1}.0")
+            self._line_total = CONSOLE_MAX_LINES
         self._console.see("end")
         self._console.config(state="disabled")
-        lines = int(self._console.index("end-1c").split(".")[0])
-        self._line_count_label.config(text=f"{lines:,} lines")
+        self._line_count_label.config(text=f"{self._line_total:,} lines")
 
     def _clear_console(self):
         self._console.config(state="normal")
         self._console.delete("1.0", "end")
         self._console.config(state="disabled")
+        self._line_total = 0
         self._line_count_label.config(text="0 lines")
 
     def _save_log(self):
@@ -720,45 +946,82 @@ class PipelinePanel(tk.Frame):
             initialfile=f"pipeline_log_{datetime.now():%Y%m%d_%H%M%S}.txt"
         )
         if path:
-            content = self._console.get("1.0", "end")
+            # Stream in line slices rather than one get() of the whole console
+            console = self._console
+            end = int(console.index("end").split(".")[0])
             with open(path, "w", encoding="utf-8") as f:
-                f.write(content)
+                for i in range(1, end, SAVE_LOG_CHUNK_LINES):
+                    f.write(console.get(f"{i}.0", f"{min(i + SAVE_LOG_CHUNK_LINES, end)}.0"))
             self._log(f"Log saved to: {path}", "success")
 
     # ── Status updates ─────────────────────────
-    def _set_status(self, label: str, color: str):
+    def _set_status(self, status: str):
+        """Apply one of the _RUN_STATUS states to the dot and label."""
+        label, color = _RUN_STATUS[status]
         self._status_label.config(text=label, fg=color)
         self._status_dot.config(fg=color)
 
     def _update_timer(self):
         if self._running and self._start_time:
             elapsed = time.time() - self._start_time
-            h = int(elapsed // 3600)
-            m = int((elapsed % 3600) // 60)
-            s = int(elapsed % 60)
-            self._elapsed_label.config(
-                text=f"Elapsed: {h:02d}:{m:02d}:{s:02d}", fg=TEXT_SECONDARY)
-            self._timer_id = self.after(1000, self._update_timer)
+            text = "Elapsed: " + _fmt_elapsed(elapsed)
+            # Skip the label reconfigure (and redraw) when nothing changed
+            if text != self._last_elapsed:
+                self._last_elapsed = text
+                self._elapsed_label.config(text=text, fg=TEXT_SECONDARY)
+            # Fire just after the next whole second so ticks don't drift
+            # across second boundaries and skip/repeat a displayed value
+            next_ms = 1000 - int((elapsed * 1000) % 1000)
+            self._timer_id = self.after(next_ms, self._update_timer)
 
     # ── Queue poller ───────────────────────────
     def _poll_queue(self):
-        try:
-            while True:
-                item = self._log_queue.get_nowait()
-                if item is None:
-                    # Process finished
-                    self._on_pipeline_finished()
-                    break
-                else:
-                    tag = self._classify_line(item)
-                    self._log(item.rstrip(), tag)
-        except queue.Empty:
-            pass
-        self.after(50, self._poll_queue)
+        # Drain everything queued since the last tick and write it in one batch.
+        # The flag is read first: the worker sets it after its last line, so
+        # once it is seen here the drain below gets every remaining line
+        finished = self._finished
+        entries = []
+        if finished or self._log_event.is_set():
+            self._log_event.clear()
+            pending = self._log_deque
+            while pending:
+                entries.append(pending.popleft())
+        self._log_bulk(entries)
+        if finished:
+            # Process finished; polling stops until the next run
+            self._on_pipeline_finished()
+            return
+        # Stay at the short interval while output streams; back off when quiet
+        if entries:
+            self._poll_ms = POLL_MIN_MS
+        else:
+            self._poll_ms = min(self._poll_ms * 2, POLL_MAX_MS)
+        self.after(self._poll_ms, self._poll_queue)
+
+    # Lines are classified on the reader thread, so the Tk thread only inserts
+    def _post_line(self, line):
+        """Queue a single line from the reader thread."""
+        self._log_deque.append((line.rstrip(), self._classify_line(line)))
+        self._log_event.set()
+
+    def _post_lines(self, lines):
+        """Queue a chunk's worth of lines with one deque operation."""
+        classify = self._classify_line
+        self._log_deque.extend([(line.rstrip(), classify(line)) for line in lines])
+        self._log_event.set()
 
     # ── Pipeline Control ───────────────────────
+    def _invalidate_command(self, *_):
+        self._cmd_cache = None
+
     def _build_command(self) -> list:
         cfg = self.app.current_config
+        cfg_key = (cfg["paths"]["projectRoot"], cfg["scripts"]["runFullPipeline"],
+                   cfg["processing"]["defaultFilesPerBatch"],
+                   cfg["processing"]["defaultDecimateRatio"])
+        if self._cmd_cache is not None and cfg_key == self._cmd_cfg_key:
+            return list(self._cmd_cache)
+
         project_root = cfg["paths"]["projectRoot"]
         pipeline_script = os.path.join(
             project_root, cfg["scripts"]["runFullPipeline"])
@@ -786,7 +1049,9 @@ class PipelinePanel(tk.Frame):
         if self._only_merge.get():
             cmd.append("-OnlyFinalMerge")
 
-        return cmd
+        self._cmd_cache = cmd
+        self._cmd_cfg_key = cfg_key
+        return list(cmd)
 
     def _run_pipeline(self):
         if self._running:
@@ -799,22 +1064,28 @@ class PipelinePanel(tk.Frame):
 
         self._running = True
         self._start_time = time.time()
+        self._last_elapsed = None
         self._run_btn.config(state="disabled")
         self._stop_btn.config(state="normal")
-        self._set_status("RUNNING", SUCCESS)
+        self._set_status("RUNNING")
         self._progress.config(mode="indeterminate")
-        self._progress.start(12)
+        self._progress.start(100)   # 10 Hz is plenty for an indeterminate bar
 
-        self._log("=" * 60, "accent")
+        self._log(_BANNER, "accent")
         self._log(f"Pipeline started", "success")
         self._log(f"Command: {' '.join(cmd)}", "dim")
-        self._log("=" * 60, "accent")
+        self._log(_BANNER, "accent")
 
         self._update_timer()
 
+        self._log_deque.clear()
+        self._log_event.clear()
+        self._finished = False
         self._thread = threading.Thread(target=self._pipeline_worker,
                                          args=(cmd,), daemon=True)
         self._thread.start()
+        self._poll_ms = POLL_MIN_MS
+        self._poll_queue()
 
     def _pipeline_worker(self, cmd: list):
         try:
@@ -822,26 +1093,43 @@ class PipelinePanel(tk.Frame):
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                bufsize=1,
+                bufsize=0,
                 creationflags=subprocess.CREATE_NO_WINDOW
                     if sys.platform == "win32" else 0
             )
 
-            for line in iter(self._process.stdout.readline, ""):
-                if line:
-                    self._log_queue.put(line)
+            # Raw pipe reads in large chunks, decoded incrementally (a UTF-8
+            # sequence split across reads is carried by the decoder); each
+            # chunk's complete lines are queued together (\r, \n and \r\n all
+            # end a line, as in text mode, so progress-bar redraws show up)
+            fd = self._process.stdout.fileno()
+            decode = codecs.getincrementaldecoder("utf-8")("replace").decode
+            pending = ""
+            while True:
+                chunk = os.read(fd, READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                text = pending + decode(chunk)
+                # Hold back an unterminated tail, and a trailing \r that may
+                # be the first half of a \r\n split across reads
+                end = len(text) - 1 if text.endswith("\r") else len(text)
+                cut = max(text.rfind("\n", 0, end), text.rfind("\r", 0, end)) + 1
+                pending = text[cut:]
+                if cut:
+                    self._post_lines(_LINE_RE.findall(text, 0, cut))
+            pending += decode(b"", True)
+            if pending:
+                self._post_line(pending)
 
             self._process.wait()
 
         except FileNotFoundError as e:
-            self._log_queue.put(f"ERROR: Could not start process: {e}")
+            self._post_line(f"ERROR: Could not start process: {e}")
         except Exception as e:
-            self._log_queue.put(f"ERROR: {e}")
+            self._post_line(f"ERROR: {e}")
         finally:
-            self._log_queue.put(None)  # Signal completion
+            self._finished = True  # Signal completion
+            self._log_event.set()
 
     def _stop_pipeline(self):
         if self._process and self._process.poll() is None:
@@ -869,20 +1157,17 @@ class PipelinePanel(tk.Frame):
 
         exit_code = self._process.returncode if self._process else -1
         elapsed = time.time() - self._start_time if self._start_time else 0
-        h = int(elapsed // 3600)
-        m = int((elapsed % 3600) // 60)
-        s = int(elapsed % 60)
 
-        self._log("=" * 60, "accent")
+        self._log(_BANNER, "accent")
         if exit_code == 0:
             self._log(f"✅  Pipeline completed successfully", "success")
-            self._set_status("COMPLETE", SUCCESS)
+            self._set_status("COMPLETE")
         else:
             self._log(f"❌  Pipeline exited with code {exit_code}", "error")
-            self._set_status("FAILED", ERROR)
+            self._set_status("FAILED")
 
-        self._log(f"Total time: {h:02d}:{m:02d}:{s:02d}", "info")
-        self._log("=" * 60, "accent")
+        self._log("Total time: " + _fmt_elapsed(elapsed), "info")
+        self._log(_BANNER, "accent")
         self._elapsed_label.config(
             fg=SUCCESS if exit_code == 0 else ERROR)
 
@@ -897,8 +1182,20 @@ class MonitorPanel(tk.Frame):
     def __init__(self, parent, app, **kwargs):
         super().__init__(parent, bg=PANEL_BG, **kwargs)
         self.app = app
-        self._watch_thread = None
+        self._observer = None
+        self._watched = None        # (path, st_dev, st_ino) the observer is on
+        # Watchdog thread -> Tk: the handler only sets this event; the
+        # watch tick on the UI thread turns it into refreshes
+        self._fs_event = threading.Event()
+        self._watch_job = None
+        self._refresh_pending = False
+        self._last_fs_event = 0.0
+        self._last_refresh = 0.0
         self._watching = False
+        # Treeview rows from the last refresh: name -> (iid, size, mtime_ns)
+        self._row_state = {}
+        self._row_dir = None
+        self._dirty = False     # a refresh was skipped while the tab was hidden
         self._watch_path = tk.StringVar()
         self._build()
 
@@ -914,11 +1211,7 @@ class MonitorPanel(tk.Frame):
         row.pack(fill="x")
         tk.Label(row, text="Watch Directory:", bg=PANEL_BG, fg=TEXT_SECONDARY,
                  font=(FONT_FAMILY, 9)).pack(side="left", padx=(0, 6))
-        tk.Entry(row, textvariable=self._watch_path, width=45,
-                 bg=INPUT_BG, fg=TEXT_PRIMARY, insertbackground=TEXT_PRIMARY,
-                 relief="flat", bd=0, highlightthickness=1,
-                 highlightbackground=INPUT_BORDER, highlightcolor=ACCENT,
-                 font=(FONT_FAMILY, 9)).pack(side="left", ipady=4, padx=(0, 6))
+        _make_entry(row, self._watch_path, 45).pack(side="left", ipady=4, padx=(0, 6))
 
         def browse():
             p = filedialog.askdirectory()
@@ -963,15 +1256,7 @@ class MonitorPanel(tk.Frame):
         cols = ("File", "Size", "Modified", "Status")
         self._tree = ttk.Treeview(list_frame, columns=cols, show="headings", height=20)
 
-        style = ttk.Style()
-        style.configure("Monitor.Treeview",
-                         background=INPUT_BG, foreground=TEXT_PRIMARY,
-                         fieldbackground=INPUT_BG, bordercolor=BORDER,
-                         rowheight=24, font=(FONT_FAMILY, 9))
-        style.configure("Monitor.Treeview.Heading",
-                         background=SIDEBAR_BG, foreground=ACCENT,
-                         font=(FONT_FAMILY, 9, "bold"), relief="flat")
-        style.map("Monitor.Treeview", background=[("selected", ACCENT_DARK)])
+        _configure_styles(self.winfo_toplevel())
         self._tree.configure(style="Monitor.Treeview")
 
         for col, w in zip(cols, [280, 90, 160, 90]):
@@ -983,25 +1268,45 @@ class MonitorPanel(tk.Frame):
         vsb.pack(side="right", fill="y")
         self._tree.pack(fill="both", expand=True)
 
+    def _is_visible(self) -> bool:
+        return self.app._notebook.select() == str(self)
+
     def _refresh(self):
+        # Hidden tab: note it and catch up when the tab is shown
+        if not self._is_visible():
+            self._dirty = True
+            return
+        self._dirty = False
+
         path = self._watch_path.get()
         if not path or not os.path.isdir(path):
             messagebox.showwarning("Monitor", "Please select a valid directory.")
             return
 
-        self._tree.delete(*self._tree.get_children())
+        rows = self._row_state
+        if path != self._row_dir:
+            self._tree.delete(*self._tree.get_children())
+            rows.clear()
+            self._row_dir = path
         total_size = 0
         counts = {"fbx": 0, "log": 0, "err": 0, "total": 0}
 
         try:
-            files = sorted(Path(path).iterdir(), key=lambda f: f.name)
-            for f in files:
-                if not f.is_file():
-                    continue
-                size = f.stat().st_size
+            # scandir: name and type come from the directory read, and
+            # DirEntry caches its stat result
+            with os.scandir(path) as it:
+                files = sorted((e for e in it if e.is_file(follow_symlinks=False)),
+                               key=lambda e: e.name)
+            # Drop vanished rows first so insert positions below line up
+            gone = rows.keys() - {f.name for f in files}
+            if gone:
+                self._tree.delete(*(rows.pop(name)[0] for name in gone))
+
+            for pos, f in enumerate(files):
+                st = f.stat()
+                size = st.st_size
                 total_size += size
-                modified = datetime.fromtimestamp(f.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
-                ext = f.suffix.lower()
+                ext = os.path.splitext(f.name)[1].lower()
 
                 counts["total"] += 1
                 if ext == ".fbx":
@@ -1020,9 +1325,17 @@ class MonitorPanel(tk.Frame):
                     status = "—"
                     tag = "other"
 
-                size_str = (f"{size/1024/1024:.2f} MB" if size > 1024*1024
-                            else f"{size/1024:.1f} KB")
-                self._tree.insert("", "end", values=(f.name, size_str, modified, status))
+                cached = rows.get(f.name)
+                if cached is not None and cached[1:] == (size, st.st_mtime_ns):
+                    continue
+                modified = _fmt_mtime(st.st_mtime_ns)
+                values = (f.name, _fmt_size(size), modified, status)
+                if cached is None:
+                    iid = self._tree.insert("", pos, values=values)
+                else:
+                    iid = cached[0]
+                    self._tree.item(iid, values=values)
+                rows[f.name] = (iid, size, st.st_mtime_ns)
 
         except Exception as e:
             messagebox.showerror("Monitor", f"Error reading directory:\n{e}")
@@ -1033,29 +1346,102 @@ class MonitorPanel(tk.Frame):
         self._stat_labels["fbx"].config(text=str(counts["fbx"]))
         self._stat_labels["log"].config(text=str(counts["log"]))
         self._stat_labels["err"].config(text=str(counts["err"]))
-        size_mb = total_size / 1024 / 1024
-        size_str = (f"{size_mb/1024:.2f} GB" if size_mb > 1024
-                    else f"{size_mb:.1f} MB")
-        self._stat_labels["size"].config(text=size_str)
+        self._stat_labels["size"].config(text=_fmt_size(total_size))
 
     def _toggle_watch(self):
         if not self._watching:
+            path = self._watch_path.get()
+            if not path or not os.path.isdir(path):
+                self._refresh()  # shows the invalid-directory warning
+                return
             self._watching = True
+            self._fs_event.clear()
+            self._arm_observer(path)
+            self._refresh()
+            self._last_refresh = time.monotonic()
+            self._watch_job = self.after(WATCH_TICK_MS, self._watch_tick)
             self._watch_btn.config(text="⏹ Stop", bg="#7f1d1d")
-            self._watch_thread = threading.Thread(target=self._watch_worker, daemon=True)
-            self._watch_thread.start()
         else:
             self._watching = False
+            self._disarm_observer()
+            if self._watch_job is not None:
+                self.after_cancel(self._watch_job)
+                self._watch_job = None
+            self._refresh_pending = False
             self._watch_btn.config(text="▶ Watch", bg=ACCENT)
 
-    def _watch_worker(self):
-        while self._watching:
-            self.after(0, self._refresh)
-            time.sleep(3)
+    def _arm_observer(self, path: str):
+        """Start a watchdog observer on path (no-op without watchdog)."""
+        if Observer is None:
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        handler = FileSystemEventHandler()
+        handler.on_any_event = lambda e: self._fs_event.set()
+        observer = Observer()
+        observer.schedule(handler, path, recursive=False)
+        observer.start()
+        self._observer = observer
+        self._watched = (path, st.st_dev, st.st_ino)
+
+    def _disarm_observer(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        self._watched = None
+
+    def _check_observer(self, path: str):
+        """
+        Re-arm the observer when the watched directory was removed and
+        recreated (cleanOutputFolders does this) or the path was changed.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Gone for now; watch again once it reappears
+            self._disarm_observer()
+            return
+        if (path, st.st_dev, st.st_ino) != self._watched:
+            self._disarm_observer()
+            self._arm_observer(path)
+            self._refresh_pending = True
+
+    def _watch_tick(self):
+        """UI-thread side of the watch: turn events (or the poll interval) into refreshes."""
+        self._watch_job = None
+        if not self._watching:
+            return
+        now  = time.monotonic()
+        path = self._watch_path.get()
+
+        if self._fs_event.is_set():
+            self._fs_event.clear()
+            self._last_fs_event = now
+            self._refresh_pending = True
+        if Observer is not None:
+            self._check_observer(path)
+        elif now - self._last_refresh >= WATCH_POLL_S:
+            self._refresh_pending = True
+
+        if (self._refresh_pending and os.path.isdir(path)
+                and (now - self._last_fs_event >= WATCH_DEBOUNCE_S
+                     or now - self._last_refresh >= WATCH_MAX_WAIT_S)):
+            self._refresh_pending = False
+            self._last_refresh = now
+            self._refresh()
+
+        self._watch_job = self.after(WATCH_TICK_MS, self._watch_tick)
 
     def set_default_path(self, path: str):
         self._watch_path.set(path)
 
+    def on_tab_shown(self):
+        if self._dirty:
+            self._refresh()
+
 
 # ─────────────────────────────────────────────
 #  MAIN APPLICATION
@@ -1080,22 +1466,20 @@ class PipelineManagerApp(tk.Tk):
         fixed_font.configure(family=FONT_MONO,     size=9)
         self.option_add("*Font", default_font)
 
-        self.current_config = copy.deepcopy(DEFAULT_CONFIG)
+        self.current_config = _fast_clone(DEFAULT_CONFIG)
         self._config_path = tk.StringVar(value="config.json")
+        # (path, bytes, st_mtime_ns, st_size) of the last config file we wrote
+        self._last_saved = None
+        # Set by traces on every config variable (and the path); the pre-run
+        # auto-save skips collect_config entirely while it is clear
+        self._cfg_dirty = True
+        self._config_path.trace_add("write", self.mark_config_dirty)
 
         # Style global ttk
-        style = ttk.Style(self)
-        style.theme_use("default")
-        style.configure("TNotebook", background=DARK_BG, borderwidth=0)
-        style.configure("TNotebook.Tab",
-                         background=SIDEBAR_BG, foreground=TEXT_DIM,
-                         padding=(16, 8), font=(FONT_FAMILY, 10))
-        style.map("TNotebook.Tab",
-                   background=[("selected", PANEL_BG)],
-                   foreground=[("selected", TEXT_PRIMARY)])
-        style.configure("Vertical.TScrollbar",
-                         troughcolor=DARK_BG, background=INPUT_BORDER,
-                         arrowcolor=TEXT_DIM, borderwidth=0)
+        _configure_styles(self)
+
+        # One permanent wheel binding; dispatched to the canvas under the pointer
+        self.bind_all("<MouseWheel>", self._on_mousewheel)
 
         self._build_titlebar()
         self._build_notebook()
@@ -1104,6 +1488,16 @@ class PipelineManagerApp(tk.Tk):
         # Load config if exists
         self._auto_load_config()
 
+    def _on_mousewheel(self, e):
+        """Scroll the nearest scrollable ancestor canvas of the widget under the pointer."""
+        w = e.widget
+        while w is not None:
+            if getattr(w, "_is_scrollable", False):
+                # Fires exactly once per physical scroll tick via bind_all
+                w.yview_scroll(-1 * (e.delta // 120), "units")
+                return
+            w = getattr(w, "master", None)
+
     # ── Title Bar ─────────────────────────────
     def _build_titlebar(self):
         bar = tk.Frame(self, bg=ACCENT_DARK, pady=6, padx=12)
@@ -1146,6 +1540,14 @@ class PipelineManagerApp(tk.Tk):
         self._notebook.add(self._config_panel,   text="⚙️  Configuration")
         self._notebook.add(self._pipeline_panel,  text="🚀  Pipeline Runner")
         self._notebook.add(self._monitor_panel,   text="📊  Batch Monitor")
+        # Open on the runner: the config form is then only built (on <Map>)
+        # if the user actually switches to it
+        self._notebook.select(self._pipeline_panel)
+        self._notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, _event):
+        if self._notebook.select() == str(self._monitor_panel):
+            self._monitor_panel.on_tab_shown()
 
     # ── Status Bar ────────────────────────────
     def _build_statusbar(self):
@@ -1162,6 +1564,9 @@ class PipelineManagerApp(tk.Tk):
     def _set_status(self, msg: str, color: str = TEXT_DIM):
         self._status_msg.config(text=msg, fg=color)
 
+    def mark_config_dirty(self, *_):
+        self._cfg_dirty = True
+
     # ── Config I/O ────────────────────────────
     def _auto_load_config(self):
         """Try to load config.json from current directory on startup."""
@@ -1177,9 +1582,9 @@ class PipelineManagerApp(tk.Tk):
 
     def _load_config_from(self, path: str):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
+            raw = _read_config_file(path)
             self.current_config = deep_merge(DEFAULT_CONFIG, raw)
+            self._cfg_dirty = True
             self._config_panel.load_from_config(self.current_config)
             self._config_path.set(path)
             self._pipeline_panel.update_config_path(path)
@@ -1210,8 +1615,8 @@ class PipelineManagerApp(tk.Tk):
         try:
             cfg = self._config_panel.collect_config()
             self.current_config = cfg
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(cfg, f, indent=2)
+            self._write_config(path, cfg)
+            self._cfg_dirty = False
             self._set_status(f"Saved: {path}", SUCCESS)
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save:\n{e}")
@@ -1232,16 +1637,43 @@ class PipelineManagerApp(tk.Tk):
     def save_config_silently(self):
         """Called by pipeline panel before run — saves without dialogs."""
         path = self._config_path.get()
-        if path:
+        if path and self._cfg_dirty:
             try:
                 cfg = self._config_panel.collect_config()
                 self.current_config = cfg
-                with open(path, "w", encoding="utf-8") as f:
-                    json.dump(cfg, f, indent=2)
-                self._set_status(f"Config auto-saved to: {path}", INFO)
+                wrote = self._write_config(path, cfg)
+                self._cfg_dirty = False
+                if wrote:
+                    self._set_status(f"Config auto-saved to: {path}", INFO)
             except Exception:
                 pass
 
+    def _write_config(self, path: str, cfg: dict) -> bool:
+        """Write cfg to path; skipped (returns False) when the file already
+        holds exactly this text and has not been touched since we wrote it."""
+        # ensure_ascii escapes everything, lone surrogates included, so this
+        # encode cannot fail on paths from undecodable Windows filenames
+        data = json.dumps(cfg, **_DUMP_KW).encode("utf-8")
+        last = self._last_saved
+        if last is not None and last[0] == path and last[1] == data:
+            try:
+                st = os.stat(path)
+                if (st.st_mtime_ns, st.st_size) == last[2:]:
+                    return False
+            except OSError:
+                pass
+        # Write a sibling temp file and swap it in, so a crash mid-save can
+        # never leave a truncated config.json behind
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        st = os.stat(path)
+        self._last_saved = (path, data, st.st_mtime_ns, st.st_size)
+        return True
+
 
 # ─────────────────────────────────────────────
 #  ENTRY POINT
@@ -28,6 +28,8 @@ $maxRayDistance  = $config.optimization.bakeMaxRayDistance
 $enableDecimate  = if ($config.optimization.enableDecimation)   { "1" } else { "0" }
 $enableBaking    = if ($config.optimization.enableNormalBaking)  { "1" } else { "0" }
 $removeHighPoly  = if ($config.options.removeHighPolyAfterBake)  { "1" } else { "0" }
+# Missing key (older configs) keeps the default of writing the .blend sidecar
+$saveBatchBlend  = if ($config.options.saveBatchBlend -eq $false)  { "0" } else { "1" }
 
 # Create batch output directory
 if (-not (Test-Path $batchOutputDir)) {
@@ -94,7 +96,8 @@ for ($batchIdx = 0; $batchIdx -lt $batches.Count; $batchIdx++) {
         $maxRayDistance,
         $enableDecimate,
         $enableBaking,
-        $removeHighPoly
+        $removeHighPoly,
+        $saveBatchBlend
     )
 
     $logFile = Join-Path $batchOutputDir "batch_$($batchNum.ToString('D4')).log"
@@ -242,6 +242,9 @@ Write-Host ""
 
 $step2StartTime = Get-Date
 
+# Older configs may not have this key; fall back to a single in-process import
+$importWorkers = if ($config.processing.finalMergeImportWorkers) { $config.processing.finalMergeImportWorkers } else { 1 }
+
 # BUG FIX: was Start-Process -Wait which creates a detached process whose stdout
 # is NOT captured by the GUI's subprocess pipe. Using & (call operator) instead
 # runs Blender inline so output streams through to the GUI console in real time.
@@ -250,7 +253,8 @@ $blenderArgs = @(
     "--python", $mergePythonScript,
     "--",
     $batchOutputDir,
-    $finalOutputFbx
+    $finalOutputFbx,
+    $importWorkers
 )
 
 & $blenderExe @blenderArgs